@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+"""
+UK Job Hunt - Offline Benchmark Suite
+Replays recorded HTML fixtures through the extraction code and runs the LLM
+analysis against a local stub Ollama server, so performance can be measured
+without the live site or a real model.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --sizes 10 100 --latency 0.2 --workers 4
+    python benchmark.py --token-latency 0.02 [--no-stream]  # streaming vs not
+    python benchmark.py --output bench.json
+    python benchmark.py --startup   # check CLI import time (exit 1 on regression)
+    python benchmark.py --memory    # bytes per job at 10k and 100k listings
+    python benchmark.py --priority 5  # suitable jobs found in the first 5 analysed
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bs4 import BeautifulSoup
+
+from config import Config
+from utils import setup_logger
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "fixtures")
+LISTING_FIXTURE = "listing_page.html"
+DETAIL_FIXTURE = "job_detail.html"
+JOB_ROW_SELECTOR = "body > div.css-py5jdu > div.css-33z2be > div.chakra-table__container.css-zipzvv > table > tbody > tr"
+
+SUITABLE_RESPONSE = """SUITABLE: YES
+CONFIDENCE: High
+REASONING: The role is aimed at recent graduates and provides mentoring. The technical requirements are fundamental programming skills.
+KEY_FACTORS: Graduate programme, mentoring, no leadership requirements"""
+
+NOT_SUITABLE_RESPONSE = """SUITABLE: NO
+CONFIDENCE: High
+REASONING: The role requires several years of commercial experience and ownership of production systems.
+KEY_FACTORS: 3+ years experience, system ownership, on-call leadership"""
+
+JUNIOR_SIGNALS = ["graduate", "junior", "early career", "entry"]
+
+# Modules that quick CLI commands must not import
+HEAVY_MODULES = [
+    "selenium", "webdriver_manager", "bs4", "html5lib", "ollama", "httpx",
+    "requests"
+]
+
+
+def tokenize(text):
+    """Split a canned response into word-sized tokens, keeping whitespace"""
+    return re.findall(r"\S+\s*", text)
+
+
+def load_fixture(name):
+    """Read a recorded HTML fixture from the fixtures directory"""
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class StubOllamaServer:
+    """Minimal HTTP server speaking the subset of the Ollama API we use"""
+
+    def __init__(self, latency=0.0, model=None, token_latency=0.0):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.model = model or Config.OLLAMA_MODEL
+        self.requests = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0),
+                                           self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path == "/api/tags":
+                    self._send_json({"models": [{"name": stub.model}]})
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                if self.path != "/api/chat":
+                    self.send_error(404)
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.requests += 1
+
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                prompt = body.get("messages", [{}])[-1].get("content", "")
+                content = stub.respond(prompt)
+                if body.get("stream"):
+                    self._stream_tokens(content)
+                    return
+
+                # Non-streaming responses arrive once generation finishes
+                time.sleep(stub.token_latency * len(tokenize(content)))
+                self._send_json({
+                    "model": stub.model,
+                    "message": {
+                        "role": "assistant",
+                        "content": content
+                    },
+                    "done": True
+                })
+
+            def _stream_tokens(self, content):
+                """Send the response as NDJSON chunks, one token at a time"""
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.end_headers()
+                try:
+                    for token in tokenize(content):
+                        time.sleep(stub.token_latency)
+                        self._write_chunk(token, False)
+                    self._write_chunk("", True)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client closed the stream to stop generation
+                    with stub._lock:
+                        stub.cancelled += 1
+                self.close_connection = True
+
+            def _write_chunk(self, token, done):
+                self.wfile.write(
+                    json.dumps({
+                        "model": stub.model,
+                        "message": {
+                            "role": "assistant",
+                            "content": token
+                        },
+                        "done": done
+                    }).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+            def _send_json(self, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def respond(self, prompt):
+        """Return a canned verdict based on the job title in the prompt"""
+        title_line = ""
+        for line in prompt.splitlines():
+            if line.startswith("JOB TITLE:"):
+                title_line = line.lower()
+                break
+
+        if any(signal in title_line for signal in JUNIOR_SIGNALS):
+            return SUITABLE_RESPONSE
+        return NOT_SUITABLE_RESPONSE
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class StageTimer:
+    """Accumulate wall-clock time and call counts per pipeline stage"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def record(self, stage, seconds, calls=1):
+        total, count = self.stages.get(stage, (0.0, 0))
+        self.stages[stage] = (total + seconds, count + calls)
+
+    def timed(self, stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.record(stage, time.perf_counter() - start)
+        return result
+
+    def as_dict(self):
+        return {
+            stage: {
+                "seconds": round(total, 6),
+                "calls": count,
+                "ms_per_call": round(total / count * 1000, 4) if count else 0
+            }
+            for stage, (total, count) in self.stages.items()
+        }
+
+
+def benchmark_extraction(scraper, iterations=200):
+    """Micro-benchmark the extraction functions on the recorded fixtures"""
+    from utils import is_within_date_range
+
+    listing_soup = BeautifulSoup(load_fixture(LISTING_FIXTURE), "html5lib")
+    rows = listing_soup.select(JOB_ROW_SELECTOR)
+    date_texts = [
+        row.select_one("td.css-xumdn4").get_text(strip=True) for row in rows
+    ]
+    detail_html = load_fixture(DETAIL_FIXTURE)
+
+    timer = StageTimer()
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for row in rows:
+            scraper._extract_job_info_from_table_row(row)
+        timer.record("extract_row", time.perf_counter() - start, len(rows))
+
+        start = time.perf_counter()
+        for text in date_texts:
+            scraper._parse_date(text)
+        timer.record("parse_date", time.perf_counter() - start,
+                     len(date_texts))
+
+        start = time.perf_counter()
+        for text in date_texts:
+            is_within_date_range(scraper._parse_date(text))
+        timer.record("parse_and_filter_date",
+                     time.perf_counter() - start, len(date_texts))
+
+    for _ in range(max(1, iterations // 10)):
+        soup = timer.timed("parse_detail_html", BeautifulSoup, detail_html,
+                           "html5lib")
+        timer.timed("extract_description", scraper._extract_description,
+                    soup)
+
+    return timer.as_dict()
+
+
+def run_pipeline(scraper, analyzer, num_jobs, workers=1):
+    """Run the listing -> filter -> detail -> analysis pipeline offline"""
+    from utils import is_excluded_job, is_within_date_range
+
+    listing_html = load_fixture(LISTING_FIXTURE)
+    detail_html = load_fixture(DETAIL_FIXTURE)
+    timer = StageTimer()
+    start = time.perf_counter()
+
+    # Listing pages: parse each "page" and extract rows until we have enough
+    jobs = []
+    rows_per_page = len(
+        BeautifulSoup(listing_html, "html5lib").select(JOB_ROW_SELECTOR))
+    for _ in range(math.ceil(num_jobs / rows_per_page)):
+        soup = timer.timed("listing_parse", BeautifulSoup, listing_html,
+                           "html5lib")
+        rows = soup.select(JOB_ROW_SELECTOR)
+        for row in rows:
+            if len(jobs) >= num_jobs:
+                break
+            job = timer.timed("row_extract",
+                              scraper._extract_job_info_from_table_row, row)
+            if job:
+                jobs.append(job)
+
+    # Keyword and date filtering
+    candidates = []
+    filter_start = time.perf_counter()
+    for job in jobs:
+        if is_excluded_job(job.title):
+            continue
+        if not is_within_date_range(job.date_posted):
+            continue
+        candidates.append(job)
+    timer.record("filter", time.perf_counter() - filter_start, len(jobs))
+
+    # Detail pages: html5lib parse plus the description selector chain
+    descriptions = []
+    for job in candidates:
+        soup = timer.timed("detail_parse", BeautifulSoup, detail_html,
+                           "html5lib")
+        descriptions.append(
+            timer.timed("description", scraper._extract_description, soup))
+
+    # LLM analysis against the stub server
+    def analyze(args):
+        job, description = args
+        return analyzer.is_suitable_for_junior(job.title, description,
+                                               job.company)
+
+    analysis_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(analyze, zip(candidates, descriptions)))
+    timer.record("analysis", time.perf_counter() - analysis_start,
+                 len(results))
+
+    elapsed = time.perf_counter() - start
+    return {
+        "jobs": num_jobs,
+        "analyzed": len(results),
+        "suitable": sum(1 for is_suitable, _, _ in results if is_suitable),
+        "seconds": round(elapsed, 4),
+        "jobs_per_sec": round(num_jobs / elapsed, 2) if elapsed else 0,
+        "stages": timer.as_dict()
+    }
+
+
+def measure_startup(command=("stats", ), budget_ms=100.0):
+    """Run a CLI command under -X importtime and check its imports
+
+    Returns (passed, import_ms, heavy_imports). Only imports after interpreter
+    start-up (site) are counted. The command runs in an empty directory so it
+    doesn't touch real results.
+    """
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "main.py")
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", main_py, *command],
+            cwd=workdir,
+            capture_output=True,
+            text=True)
+
+    total_us = 0
+    after_site = False
+    heavy = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+
+        module = name.strip()
+        top_level = name[1:2] != " "
+        if top_level and module == "site":
+            after_site = True
+            continue
+        if after_site and top_level:
+            total_us += int(cumulative)
+        if module.split(".")[0] in HEAVY_MODULES:
+            heavy.add(module.split(".")[0])
+
+    import_ms = total_us / 1000
+    passed = result.returncode == 0 and not heavy and import_ms <= budget_ms
+    return passed, import_ms, sorted(heavy)
+
+
+def _fresh(text):
+    """Copy of a string as a separate object, as if parsed from a new page"""
+    return (text + " ")[:-1]
+
+
+def measure_job_memory(scraper, count):
+    """Bytes per analysed job for `count` listings: Job records vs dicts
+
+    Strings are copied per job, as they would be when parsed from each row,
+    so the Job's interning of company/location is reflected. Descriptions
+    are not included (they are released after analysis).
+    """
+    from models import Job
+
+    rows = BeautifulSoup(load_fixture(LISTING_FIXTURE),
+                         "html5lib").select(JOB_ROW_SELECTOR)
+    templates = [scraper._extract_job_info_from_table_row(row) for row in rows]
+
+    def build(factory):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        jobs = [
+            factory(templates[i % len(templates)], i) for i in range(count)
+        ]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del jobs
+        return used / count
+
+    def make_job(t, i):
+        return Job(_fresh(t.title),
+                   f"{t.url}-{i}",
+                   _fresh(t.company),
+                   _fresh(t.location),
+                   t.date_posted,
+                   _fresh(t.raw_date_text),
+                   is_suitable=False,
+                   confidence=_fresh("High"),
+                   reasoning=_fresh("Requires several years of experience."),
+                   application_url=f"{t.url}-{i}/apply")
+
+    def make_dict(t, i):
+        return {
+            'title': _fresh(t.title),
+            'url': f"{t.url}-{i}",
+            'company': _fresh(t.company),
+            'location': _fresh(t.location),
+            'date_posted': t.date_posted,
+            'raw_date_text': _fresh(t.raw_date_text),
+            'is_suitable': False,
+            'confidence': _fresh("High"),
+            'reason': _fresh("Requires several years of experience."),
+            'application_url': f"{t.url}-{i}/apply"
+        }
+
+    return {
+        "job": round(build(make_job), 1),
+        "dict": round(build(make_dict), 1)
+    }
+
+
+def measure_priority(scraper, budget):
+    """Suitable jobs found when only `budget` jobs can be analysed
+
+    Compares listing order with prioritized order on the listing fixture.
+    A job counts as suitable if the stub server would say so; excluded jobs
+    are skipped without using the budget, as in the real pipeline.
+    """
+    from prioritizer import JobPrioritizer, prioritized
+    from utils import is_excluded_job
+
+    rows = BeautifulSoup(load_fixture(LISTING_FIXTURE),
+                         "html5lib").select(JOB_ROW_SELECTOR)
+    jobs = [scraper._extract_job_info_from_table_row(row) for row in rows]
+
+    def is_suitable(job):
+        return any(signal in job.title.lower() for signal in JUNIOR_SIGNALS)
+
+    def suitable_found(ordered):
+        analysed = [job for job in ordered if not is_excluded_job(job.title)]
+        return sum(1 for job in analysed[:budget] if is_suitable(job))
+
+    return {
+        "listing_order": suitable_found(jobs),
+        "prioritized": suitable_found(
+            prioritized(iter(jobs), JobPrioritizer())),
+        "total_suitable": sum(1 for job in jobs if is_suitable(job))
+    }
+
+
+def print_stages(stages):
+    print(f"  {'stage':<24}{'calls':>8}{'total s':>12}{'ms/call':>12}")
+    for stage, stats in stages.items():
+        print(f"  {stage:<24}{stats['calls']:>8}{stats['seconds']:>12.4f}"
+              f"{stats['ms_per_call']:>12.4f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Offline benchmark for the scraper and LLM analyzer")
+    parser.add_argument("--sizes",
+                        type=int,
+                        nargs="+",
+                        default=[10, 100, 1000],
+                        help="Number of jobs for each end-to-end run")
+    parser.add_argument("--latency",
+                        type=float,
+                        default=0.05,
+                        help="Stub Ollama response latency in seconds")
+    parser.add_argument("--token-latency",
+                        type=float,
+                        default=0.0,
+                        help="Stub Ollama generation time per token in seconds")
+    parser.add_argument("--no-stream",
+                        action="store_true",
+                        help="Wait for complete LLM responses (LLM_STREAM off)")
+    parser.add_argument("--workers",
+                        type=int,
+                        default=1,
+                        help="Concurrent analysis requests")
+    parser.add_argument("--iterations",
+                        type=int,
+                        default=200,
+                        help="Iterations for the extraction micro-benchmarks")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--memory",
+                        action="store_true",
+                        help="Only measure per-job memory at 10k and 100k")
+    parser.add_argument("--startup",
+                        action="store_true",
+                        help="Only check CLI start-up import time")
+    parser.add_argument("--priority",
+                        type=int,
+                        metavar="BUDGET",
+                        help="Only compare suitable jobs found in the first "
+                        "BUDGET analysed, listing order vs prioritized")
+    parser.add_argument("--startup-budget-ms",
+                        type=float,
+                        default=100.0,
+                        help="Maximum import time for 'main.py stats'")
+    args = parser.parse_args(argv)
+    setup_logger()
+
+    if args.memory:
+        from scraper import JobScraper
+
+        logging.disable(logging.INFO)
+        Config.PAGE_CACHE_ENABLED = False
+        scraper = JobScraper()
+        print(f"  {'jobs':>8}{'Job bytes/job':>16}{'dict bytes/job':>17}")
+        for count in (10_000, 100_000):
+            result = measure_job_memory(scraper, count)
+            print(f"  {count:>8}{result['job']:>16.1f}{result['dict']:>17.1f}")
+        return 0
+
+    if args.priority:
+        from scraper import JobScraper
+
+        logging.disable(logging.INFO)
+        Config.PAGE_CACHE_ENABLED = False
+        result = measure_priority(JobScraper(), args.priority)
+        print(f"Suitable jobs in the first {args.priority} analysed "
+              f"(of {result['total_suitable']} in the listing):")
+        print(f"  listing order: {result['listing_order']}")
+        print(f"  prioritized:   {result['prioritized']}")
+        return 0
+
+    if args.startup:
+        passed, import_ms, heavy = measure_startup(
+            budget_ms=args.startup_budget_ms)
+        print(f"'main.py stats' imports: {import_ms:.1f}ms "
+              f"(budget {args.startup_budget_ms:.0f}ms)")
+        if heavy:
+            print(f"Heavy modules imported: {', '.join(heavy)}")
+        print("PASS" if passed else "FAIL")
+        return 0 if passed else 1
+
+    # Per-job INFO logging would dominate the timings
+    logging.disable(logging.INFO)
+
+    stub = StubOllamaServer(latency=args.latency,
+                            token_latency=args.token_latency).start()
+    Config.OLLAMA_BASE_URL = stub.url
+    if args.no_stream:
+        Config.LLM_STREAM = False
+    Config.PAGE_CACHE_ENABLED = False
+
+    from scraper import JobScraper
+    from llm_analyzer import JobAnalyzer
+
+    scraper = JobScraper()
+    analyzer = JobAnalyzer()
+    results = {
+        "latency": args.latency,
+        "token_latency": args.token_latency,
+        "stream": Config.LLM_STREAM,
+        "workers": args.workers,
+        "extraction": {},
+        "runs": []
+    }
+
+    try:
+        if not analyzer.test_connection():
+            print("Stub Ollama server did not respond", file=sys.stderr)
+            return 1
+
+        print("Extraction micro-benchmarks:")
+        results["extraction"] = benchmark_extraction(scraper, args.iterations)
+        print_stages(results["extraction"])
+
+        for size in args.sizes:
+            run = run_pipeline(scraper, analyzer, size, args.workers)
+            results["runs"].append(run)
+            print(f"\nEnd-to-end: {run['jobs']} jobs, {run['analyzed']} "
+                  f"analyzed, {run['suitable']} suitable in "
+                  f"{run['seconds']:.2f}s ({run['jobs_per_sec']} jobs/sec)")
+            print_stages(run["stages"])
+
+        results["cancelled_generations"] = stub.cancelled
+        if stub.cancelled:
+            print(f"\nGenerations stopped early: {stub.cancelled}")
+    finally:
+        stub.stop()
+        scraper.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,13 +13,35 @@ class Config:
 
     # LLM settings
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma3:latest")
-    OLLAMA_BASE_URL = "http://localhost:11434"
+    OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    # Read responses as they are generated, and stop generating once the
+    # model has given a high-confidence NO verdict
+    LLM_STREAM = os.getenv("LLM_STREAM", "True").lower() == "true"
+    LLM_EARLY_STOP = os.getenv("LLM_EARLY_STOP", "True").lower() == "true"
 
     # Scraping settings
     MAX_JOBS_TO_PROCESS = int(os.getenv("MAX_JOBS_TO_PROCESS", "50"))
     HEADLESS_BROWSER = os.getenv("HEADLESS_BROWSER", "True").lower() == "true"
     DELAY_BETWEEN_REQUESTS = float(os.getenv("DELAY_BETWEEN_REQUESTS", "2"))
 
+    # Adaptive rate limiting per host (requests per second). Starts at one
+    # request every DELAY_BETWEEN_REQUESTS seconds and adapts to the server.
+    RATE_LIMIT_RPS = float(
+        os.getenv("RATE_LIMIT_RPS", str(1 / max(DELAY_BETWEEN_REQUESTS,
+                                                0.01))))
+    RATE_LIMIT_MIN_RPS = float(os.getenv("RATE_LIMIT_MIN_RPS", "0.1"))
+    RATE_LIMIT_MAX_RPS = float(os.getenv("RATE_LIMIT_MAX_RPS", "2"))
+    # Page loads slower than this (seconds) stop the rate from increasing
+    RATE_LIMIT_TARGET_LATENCY = float(
+        os.getenv("RATE_LIMIT_TARGET_LATENCY", "3"))
+
+    # Retries for transient failures (timeouts, 429, 5xx)
+    MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+    RETRY_BUDGET = int(os.getenv("RETRY_BUDGET",
+                                 "20"))  # Total retries per run
+    BACKOFF_BASE = float(os.getenv("BACKOFF_BASE", "1"))
+    BACKOFF_MAX = float(os.getenv("BACKOFF_MAX", "60"))
+
     # Filtering keywords (jobs starting with these will be excluded)
     EXCLUDED_KEYWORDS = [
         "senior", "staff", "lead", "principal", "head", "lead"
@@ -31,9 +53,61 @@ class Config:
     MIN_JOB_AGE_DAYS = int(os.getenv("MIN_JOB_AGE_DAYS",
                                      "0"))  # Jobs posted at least N days ago
 
+    # Detail page cache (pages newer than PAGE_CACHE_MAX_AGE_HOURS are not
+    # refetched; older ones are revalidated with a conditional request)
+    PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED",
+                                   "True").lower() == "true"
+    PAGE_CACHE_FILE = os.getenv("PAGE_CACHE_FILE", "page_cache.db")
+    PAGE_CACHE_MAX_AGE_HOURS = float(os.getenv("PAGE_CACHE_MAX_AGE_HOURS",
+                                               "24"))
+    # Skip LLM analysis for postings whose description hasn't changed since
+    # they were last analysed
+    SKIP_UNCHANGED_JOBS = os.getenv("SKIP_UNCHANGED_JOBS",
+                                    "True").lower() == "true"
+
+    # Sharded runs (see shard.py)
+    SHARD_COUNT = int(os.getenv("SHARD_COUNT", str(os.cpu_count() or 4)))
+    SHARD_DIR = os.getenv("SHARD_DIR", "shards")
+
+    # Watch mode (see daemon.py)
+    POLL_INTERVAL_MINUTES = float(os.getenv("POLL_INTERVAL_MINUTES", "60"))
+    POLL_JITTER_MINUTES = float(os.getenv("POLL_JITTER_MINUTES", "5"))
+    STATUS_PORT = int(os.getenv("STATUS_PORT", "8765"))
+
+    # Store of analysed job descriptions and verdicts (used by reanalyze)
+    JOB_STORE_ENABLED = os.getenv("JOB_STORE_ENABLED",
+                                  "True").lower() == "true"
+    JOB_STORE_FILE = os.getenv("JOB_STORE_FILE", "jobs.db")
+    REANALYZE_WORKERS = int(os.getenv("REANALYZE_WORKERS", "2"))
+
+    # Analyse the most promising jobs first (title, recency and company
+    # history). PRIORITY_WINDOW is how many listings are buffered and ranked
+    # at once (about one results page; capped at half of MAX_JOBS_TO_PROCESS
+    # so processing starts before the last page is scraped);
+    # RUN_TIME_BUDGET_MINUTES stops a run after that long (0 = no limit)
+    PRIORITIZE_JOBS = os.getenv("PRIORITIZE_JOBS", "True").lower() == "true"
+    PRIORITY_WINDOW = int(os.getenv("PRIORITY_WINDOW", "20"))
+    RUN_TIME_BUDGET_MINUTES = float(os.getenv("RUN_TIME_BUDGET_MINUTES", "0"))
+
     # Output files
     OUTPUT_FILE = "suitable_jobs.csv"
+    # Formats written alongside the CSV (which is always written):
+    # jsonl, sqlite, parquet (needs pyarrow). Same name as OUTPUT_FILE with
+    # the format's extension.
+    OUTPUT_FORMATS = [
+        name.strip().lower()
+        for name in os.getenv("OUTPUT_FORMATS", "csv").split(",")
+        if name.strip()
+    ]
+    OUTPUT_BATCH_SIZE = int(os.getenv("OUTPUT_BATCH_SIZE", "20"))
+    # Rewritten at the end of each run with only the jobs that run added
+    # (empty to disable)
+    NEW_JOBS_FILE = os.getenv("NEW_JOBS_FILE", "new_suitable_jobs.jsonl")
     LOG_FILE = "job_analysis.log"
 
+    # Logging settings (use WARNING to drop per-job INFO messages under load)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_JSON = os.getenv("LOG_JSON", "False").lower() == "true"
+
     # User agent for requests
     USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+UK Job Hunt - Watch Mode
+Runs as a long-lived service that polls the job listings on a schedule and
+only processes postings it hasn't seen yet. The browsers, the Ollama client
+and the de-duplication index stay warm between cycles, and a small local HTTP
+endpoint reports status (/status) and metrics (/metrics).
+
+Usage:
+    python daemon.py
+    python daemon.py --interval 30 --port 8765
+"""
+
+import argparse
+import json
+import logging
+import random
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import Config
+from dates import reset_date_window
+from utils import setup_logger, set_log_job_id, load_existing_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class JobWatcher:
+    """Poll the job listings periodically and process new postings"""
+
+    def __init__(self, interval_minutes=None, jitter_minutes=None):
+        from scraper import JobScraper
+        from llm_analyzer import JobAnalyzer
+        from job_store import JobStore
+
+        self.interval = (interval_minutes if interval_minutes is not None
+                         else Config.POLL_INTERVAL_MINUTES) * 60
+        self.jitter = (jitter_minutes if jitter_minutes is not None else
+                       Config.POLL_JITTER_MINUTES) * 60
+
+        self.scraper = JobScraper()
+        self.analyzer = JobAnalyzer()
+        self.store = JobStore() if Config.JOB_STORE_ENABLED else None
+        self.existing_jobs = load_existing_jobs()
+        self.seen_urls = set()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+
+        self.state = "starting"
+        self.started_at = time.time()
+        self.last_cycle_started = None
+        self.last_cycle_finished = None
+        self.next_poll_at = None
+        self.last_error = ""
+        self.metrics = {
+            'cycles': 0,
+            'cycle_errors': 0,
+            'jobs_seen': 0,
+            'jobs_processed': 0,
+            'jobs_suitable': 0,
+            'jobs_added': 0,
+            'last_cycle_seconds': 0.0
+        }
+
+    def _count(self, name, amount=1):
+        with self.lock:
+            self.metrics[name] += amount
+
+    def run_cycle(self):
+        """Process all postings not seen in earlier cycles"""
+        from pipeline import process_job, SKIPPED, FETCH_FAILED, SUITABLE
+        from prioritizer import JobPrioritizer, prioritized
+        from results_writer import ResultsWriter
+
+        reset_date_window()
+        # RETRY_BUDGET is per run, and each cycle is a run
+        self.scraper.rate_limiter.reset_budget()
+        self.state = "polling"
+        self.last_cycle_started = time.time()
+        new_postings = 0
+
+        listings = self.scraper.iter_job_listings()
+        job_listings = listings
+        if Config.PRIORITIZE_JOBS:
+            prioritizer = JobPrioritizer(
+                self.store.company_history() if self.store else None)
+            # Already-seen postings are dropped before they take up the window
+            job_listings = prioritized(
+                (job for job in listings if job.url not in self.seen_urls),
+                prioritizer)
+        # Each cycle is one run: NEW_JOBS_FILE lists what this cycle added
+        writer = ResultsWriter(
+            existing_jobs=self.existing_jobs,
+            on_saved=self.scraper.mark_description_analyzed)
+        try:
+            for job in job_listings:
+                if self.stop_event.is_set():
+                    break
+                if job.url in self.seen_urls:
+                    continue
+
+                new_postings += 1
+
+                set_log_job_id(job.url)
+                try:
+                    status = process_job(job, self.scraper, self.analyzer,
+                                         self.store)
+                    if status == FETCH_FAILED:
+                        # Not marked as seen, so it is retried next cycle
+                        continue
+
+                    self.seen_urls.add(job.url)
+                    self._count('jobs_seen')
+                    if status == SKIPPED:
+                        continue
+
+                    self._count('jobs_processed')
+                    if status == SUITABLE:
+                        self._count('jobs_suitable')
+                        writer.add(job)
+                except Exception as e:
+                    logger.error(f"Error processing job {job.title}: {str(e)}")
+                    # Retry this posting next cycle
+                    self.seen_urls.discard(job.url)
+            set_log_job_id(None)
+        finally:
+            job_listings.close()
+            listings.close()
+            self._count('jobs_added', writer.close())
+
+        self.last_cycle_finished = time.time()
+        self._count('cycles')
+        with self.lock:
+            self.metrics['last_cycle_seconds'] = round(
+                self.last_cycle_finished - self.last_cycle_started, 3)
+        logger.info(f"Poll cycle complete: {new_postings} new postings")
+
+    def run(self):
+        """Poll until stopped"""
+        if not self.analyzer.test_connection():
+            logger.error(
+                "Cannot connect to Ollama. Please ensure it's running with the required model."
+            )
+            return 1
+
+        while not self.stop_event.is_set():
+            try:
+                self.run_cycle()
+            except Exception as e:
+                self._count('cycle_errors')
+                self.last_error = str(e)
+                logger.error(f"Poll cycle failed: {str(e)}")
+                # Restart the browsers on the next cycle in case they died
+                self.scraper.close_drivers()
+
+            delay = max(0.0,
+                        self.interval + random.uniform(-self.jitter,
+                                                       self.jitter))
+            self.next_poll_at = time.time() + delay
+            self.state = "sleeping"
+            logger.info(f"Next poll in {delay / 60:.1f} minutes")
+            self.stop_event.wait(delay)
+
+        self.state = "stopped"
+        return 0
+
+    def stop(self):
+        self.stop_event.set()
+
+    def close(self):
+        self.scraper.close()
+        if self.store:
+            self.store.close()
+
+    def status(self):
+        """Current status as a JSON-serialisable dict"""
+
+        def iso(timestamp):
+            return (datetime.fromtimestamp(timestamp).isoformat(
+                timespec="seconds") if timestamp else None)
+
+        with self.lock:
+            metrics = dict(self.metrics)
+        return {
+            'state': self.state,
+            'started_at': iso(self.started_at),
+            'last_cycle_started': iso(self.last_cycle_started),
+            'last_cycle_finished': iso(self.last_cycle_finished),
+            'next_poll_at': iso(self.next_poll_at),
+            'last_error': self.last_error,
+            'known_jobs': len(self.existing_jobs),
+            'metrics': metrics
+        }
+
+    def prometheus_metrics(self):
+        """Metrics in the Prometheus text exposition format"""
+        with self.lock:
+            metrics = dict(self.metrics)
+        lines = []
+        for name, value in metrics.items():
+            kind = "gauge" if name == "last_cycle_seconds" else "counter"
+            lines.append(f"# TYPE jobhunt_{name} {kind}")
+            lines.append(f"jobhunt_{name} {value}")
+        lines.append("# TYPE jobhunt_seen_urls gauge")
+        lines.append(f"jobhunt_seen_urls {len(self.seen_urls)}")
+        return "\n".join(lines) + "\n"
+
+
+def start_status_server(watcher, port, host="127.0.0.1"):
+    """Serve /status (JSON) and /metrics (Prometheus text) in a thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path == "/status":
+                body = json.dumps(watcher.status(), indent=2).encode("utf-8")
+                content_type = "application/json"
+            elif self.path == "/metrics":
+                body = watcher.prometheus_metrics().encode("utf-8")
+                content_type = "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"Status endpoint listening on http://{host}:{port}/status")
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Poll for new jobs on a schedule")
+    parser.add_argument("--interval",
+                        type=float,
+                        default=Config.POLL_INTERVAL_MINUTES,
+                        help="Minutes between polls")
+    parser.add_argument("--jitter",
+                        type=float,
+                        default=Config.POLL_JITTER_MINUTES,
+                        help="Random +/- minutes added to each interval")
+    parser.add_argument("--port",
+                        type=int,
+                        default=Config.STATUS_PORT,
+                        help="Port for the status endpoint (0 disables it)")
+    args = parser.parse_args(argv)
+    setup_logger()
+
+    watcher = JobWatcher(args.interval, args.jitter)
+    server = start_status_server(watcher, args.port) if args.port else None
+
+    def handle_signal(signum, frame):
+        logger.info("Stopping watch mode...")
+        watcher.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    try:
+        return watcher.run()
+    finally:
+        if server:
+            server.shutdown()
+        watcher.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
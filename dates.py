@@ -0,0 +1,122 @@
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from config import Config
+
+# Relative dates (e.g. "2 days ago", "1 week ago"), checked in this order
+RELATIVE_DATE_PATTERNS = [
+    ("day", re.compile(r'(\d+)\s*day'), 1),
+    ("week", re.compile(r'(\d+)\s*week'), 7),
+    ("month", re.compile(r'(\d+)\s*month'), 30),
+]
+
+# Absolute dates
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")  # YYYY-MM-DD
+NUMERIC_DATE_PATTERNS = [
+    re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"),  # MM/DD/YYYY or DD/MM/YYYY
+    re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"),  # MM-DD-YYYY or DD-MM-YYYY
+]
+
+# Run-scoped date window, created on first use
+_date_window = None
+
+
+class DateWindow:
+    """Reference date and posting-age cutoffs for a single run"""
+
+    def __init__(self, today=None, max_age_days=None, min_age_days=None):
+        if max_age_days is None:
+            max_age_days = Config.MAX_JOB_AGE_DAYS
+        if min_age_days is None:
+            min_age_days = Config.MIN_JOB_AGE_DAYS
+
+        self.today = today or date.today()
+        self.earliest = self.today - timedelta(days=max_age_days)
+        self.latest = self.today - timedelta(days=min_age_days)
+
+    def parse(self, date_text):
+        """Parse a listing date relative to this window's reference date"""
+        return parse_posted_date(date_text, self.today)
+
+    def contains(self, posted_date):
+        """Check if a posting date falls inside the window"""
+        if posted_date is None:
+            return True  # If no date available, include the job
+        return self.earliest <= posted_date <= self.latest
+
+
+def get_date_window():
+    """Return the date window for the current run"""
+    global _date_window
+    if _date_window is None:
+        _date_window = DateWindow()
+    return _date_window
+
+
+def reset_date_window():
+    """Start a new run: recompute "today" and the age cutoffs on next use"""
+    global _date_window
+    _date_window = None
+
+
+def parse_posted_date(date_text, today=None):
+    """Parse a listing date into a date object, or None if unrecognised"""
+    if not date_text:
+        return None
+
+    if today is None:
+        today = get_date_window().today
+
+    return _parse_posted_date(date_text.lower().strip(), today)
+
+
+@lru_cache(maxsize=1024)
+def _parse_posted_date(date_text, today):
+    # Handle relative dates (e.g., "2 days ago", "1 week ago")
+    if "ago" in date_text:
+        for unit, pattern, unit_days in RELATIVE_DATE_PATTERNS:
+            if unit in date_text:
+                match = pattern.search(date_text)
+                if match:
+                    return today - timedelta(days=int(match.group(1)) *
+                                             unit_days)
+                break
+        else:
+            if "hour" in date_text:
+                return today
+
+    # Handle absolute dates
+    match = ISO_DATE_PATTERN.search(date_text)
+    if match:
+        year, month, day = match.groups()
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+
+    for pattern in NUMERIC_DATE_PATTERNS:
+        match = pattern.search(date_text)
+        if match:
+            part1, part2, year = match.groups()
+            # Simple heuristic: if first part > 12, assume DD/MM
+            if int(part1) > 12:
+                day, month = part1, part2
+            else:
+                month, day = part1, part2
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                continue
+
+    return None
+
+
+def to_date(value):
+    """Coerce a date, datetime or YYYY-MM-DD string to a date (or None)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
@@ -0,0 +1,118 @@
+import sqlite3
+import time
+import zlib
+from config import Config
+from dates import to_date
+from models import Job
+
+
+class JobStore:
+    """SQLite store of analysed jobs: listing details, description and verdict
+
+    Descriptions are stored zlib-compressed. Each row keeps the verdict from
+    the most recent analysis along with the model and prompt version that
+    produced it, so stored jobs can be re-scored offline.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.JOB_STORE_FILE
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                date_posted TEXT,
+                application_url TEXT,
+                description BLOB,
+                suitable INTEGER,
+                confidence TEXT,
+                reasoning TEXT,
+                model TEXT,
+                prompt_version TEXT,
+                analyzed_at REAL
+            )""")
+        self.conn.commit()
+
+    def save_analysis(self, job, model, prompt_version):
+        """Insert or update a Job with its description and latest verdict"""
+        self.conn.execute(
+            """
+            INSERT INTO jobs (url, title, company, location, date_posted,
+                              description, suitable, confidence, reasoning,
+                              model, prompt_version, analyzed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                title = excluded.title,
+                company = excluded.company,
+                location = excluded.location,
+                date_posted = excluded.date_posted,
+                description = excluded.description,
+                suitable = excluded.suitable,
+                confidence = excluded.confidence,
+                reasoning = excluded.reasoning,
+                model = excluded.model,
+                prompt_version = excluded.prompt_version,
+                analyzed_at = excluded.analyzed_at
+            """, (job.url, job.title, job.company, job.location,
+                  job.date_posted.isoformat() if job.date_posted else None,
+                  zlib.compress(job.description.encode("utf-8")),
+                  int(job.is_suitable), job.confidence, job.reasoning, model,
+                  prompt_version, time.time()))
+        self.conn.commit()
+
+    def update_verdict(self, url, is_suitable, reasoning, confidence, model,
+                       prompt_version):
+        """Replace the stored verdict for a job after re-analysis"""
+        self.conn.execute(
+            """
+            UPDATE jobs SET suitable = ?, confidence = ?, reasoning = ?,
+                            model = ?, prompt_version = ?, analyzed_at = ?
+            WHERE url = ?
+            """, (int(is_suitable), confidence, reasoning, model,
+                  prompt_version, time.time(), url))
+        self.conn.commit()
+
+    def set_application_url(self, url, application_url):
+        self.conn.execute("UPDATE jobs SET application_url = ? WHERE url = ?",
+                          (application_url, url))
+        self.conn.commit()
+
+    def iter_jobs(self):
+        """Yield stored jobs as Job records with their stored verdict
+
+        Each Job carries its decompressed description; release it once used.
+        """
+        cursor = self.conn.execute(
+            "SELECT url, title, company, location, date_posted, "
+            "application_url, description, suitable, confidence, reasoning "
+            "FROM jobs ORDER BY analyzed_at")
+        for row in cursor:
+            (url, title, company, location, date_posted, application_url,
+             description, suitable, confidence, reasoning) = row
+            yield Job(title,
+                      url,
+                      company,
+                      location,
+                      to_date(date_posted),
+                      description=zlib.decompress(description).decode("utf-8"),
+                      is_suitable=bool(suitable),
+                      confidence=confidence or "",
+                      reasoning=reasoning or "",
+                      application_url=application_url or "")
+
+    def company_history(self):
+        """Map each company to (suitable jobs, analysed jobs)"""
+        return {
+            company: (suitable, total)
+            for company, suitable, total in self.conn.execute(
+                "SELECT company, SUM(suitable), COUNT(*) FROM jobs "
+                "WHERE company != '' GROUP BY company")
+        }
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -1,9 +1,20 @@
 import ollama
+import hashlib
 import json
+import logging
+import re
 from config import Config
-from utils import setup_logger, clean_text
+from utils import clean_text
 
-logger = setup_logger()
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are an expert career advisor specializing in software engineering roles. Analyze job postings to determine if they are suitable for junior software engineers (0-2 years experience)."
+
+CONFIDENCE_PATTERN = re.compile(r'CONFIDENCE:\s*(high|medium|low)',
+                                re.IGNORECASE)
+VERDICT_PATTERN = re.compile(r'SUITABLE:\W*(yes|no)\b', re.IGNORECASE)
+
+EARLY_STOP_REASONING = "Clear NO verdict (high confidence); generation stopped before the reasoning"
 
 
 class JobAnalyzer:
@@ -21,21 +32,13 @@ class JobAnalyzer:
                                               company)
 
         try:
-            response = self.client.chat(
-                model=Config.OLLAMA_MODEL,
-                messages=[{
-                    "role":
-                    "system",
-                    "content":
-                    "You are an expert career advisor specializing in software engineering roles. Analyze job postings to determine if they are suitable for junior software engineers (0-2 years experience)."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }])
-
-            analysis_result = response['message']['content']
+            analysis_result, stopped_early = self._chat(prompt)
             logger.info(f"LLM Analysis completed for: {job_title}")
 
+            if stopped_early:
+                logger.info(f"Stopped generation early (clear NO): {job_title}")
+                return False, EARLY_STOP_REASONING, analysis_result
+
             # Parse the response to determine suitability
             is_suitable, reasoning = self._parse_analysis_result(
                 analysis_result)
@@ -46,6 +49,61 @@ class JobAnalyzer:
             logger.error(f"Error analyzing job with LLM: {str(e)}")
             return False, f"Analysis failed: {str(e)}", ""
 
+    def _chat(self, prompt):
+        """Send the analysis prompt and return (response_text, stopped_early)
+
+        With LLM_STREAM the response is read token by token. With
+        LLM_EARLY_STOP as well, generation is cancelled (by closing the
+        stream) once the model has answered NO with high confidence; the
+        reasoning that follows is only needed for jobs we save.
+        """
+        messages = [{
+            "role": "system",
+            "content": SYSTEM_PROMPT
+        }, {
+            "role": "user",
+            "content": prompt
+        }]
+
+        if not Config.LLM_STREAM:
+            response = self.client.chat(model=Config.OLLAMA_MODEL,
+                                        messages=messages)
+            return response['message']['content'], False
+
+        stream = self.client.chat(model=Config.OLLAMA_MODEL,
+                                  messages=messages,
+                                  stream=True)
+        analysis_result = ""
+        checking = Config.LLM_EARLY_STOP
+        try:
+            for chunk in stream:
+                analysis_result += chunk['message']['content']
+                if checking:
+                    rejection = self._is_clear_rejection(analysis_result)
+                    if rejection:
+                        return analysis_result, True
+                    # Once the verdict is settled the rest is just read
+                    checking = rejection is None
+        finally:
+            stream.close()
+
+        return analysis_result, False
+
+    def _is_clear_rejection(self, partial_text):
+        """Whether a partial response already says NO with high confidence
+
+        Returns None while the verdict or confidence line is still to come,
+        and False once they have been given otherwise (or the reasoning has
+        started without them).
+        """
+        verdict = VERDICT_PATTERN.search(partial_text)
+        confidence = self.parse_confidence(partial_text)
+        if verdict and confidence:
+            return verdict.group(1).lower() == "no" and confidence == "High"
+        if "REASONING:" in partial_text:
+            return False
+        return None
+
     def _create_analysis_prompt(self, job_title, job_description, company):
         """Create a detailed prompt for job analysis"""
 
@@ -124,6 +182,16 @@ Be thorough but concise in your analysis.
 
         return is_suitable, reasoning
 
+    def parse_confidence(self, analysis_text):
+        """Extract the CONFIDENCE level (High/Medium/Low) from the response"""
+        match = CONFIDENCE_PATTERN.search(analysis_text)
+        return match.group(1).capitalize() if match else ""
+
+    def prompt_version(self):
+        """Short hash identifying the current system and analysis prompts"""
+        template = SYSTEM_PROMPT + self._create_analysis_prompt("", "", "")
+        return hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+
     def test_connection(self):
         """Test if Ollama is running and model is available"""
         try:
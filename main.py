@@ -2,19 +2,39 @@
 """
 UK Job Hunt - Software Engineering Jobs Scraper
 Searches for junior-level software engineering jobs and analyzes them with LLM
+
+Usage:
+    python main.py [run]      Scrape, analyse and save suitable jobs (default)
+    python main.py stats      Summarise the saved results
+    python main.py export     Export the saved results as CSV or JSON
+    python main.py reanalyze  Re-score stored jobs with the current model/prompt
+    python main.py watch ...  Poll for new jobs on a schedule (see daemon.py)
+    python main.py shard ...  Split a run across processes (see shard.py)
+
+Heavy dependencies (Selenium, BeautifulSoup, Ollama) are only imported by the
+commands that need them, so quick commands start fast.
 """
 
+import argparse
+import logging
 import sys
-import time
-from datetime import datetime
-from scraper import JobScraper
-from llm_analyzer import JobAnalyzer
-from utils import setup_logger, is_excluded_job, save_suitable_job, is_within_date_range
+from utils import setup_logger, set_log_job_id
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 
-def main():
-    logger = setup_logger()
+def run_search():
+    """Scrape the listings, analyse each job and save the suitable ones"""
+    import time
+    from scraper import JobScraper
+    from llm_analyzer import JobAnalyzer
+    from pipeline import process_job, SKIPPED, FETCH_FAILED, SUITABLE
+    from job_store import JobStore
+    from prioritizer import JobPrioritizer, prioritized
+    from results_writer import ResultsWriter
+
+    setup_logger()
     logger.info("=" * 60)
     logger.info("UK Job Hunt - Software Engineering Jobs Scraper")
     logger.info("=" * 60)
@@ -26,6 +46,10 @@ def main():
     # Initialize components
     scraper = JobScraper()
     analyzer = JobAnalyzer()
+    store = JobStore() if Config.JOB_STORE_ENABLED else None
+    # Suitable jobs are marked analysed in the page cache only once saved
+    writer = ResultsWriter(on_saved=scraper.mark_description_analyzed)
+    job_listings = None
 
     try:
         # Test LLM connection first
@@ -37,105 +61,80 @@ def main():
             logger.error(f"Run: ollama pull {Config.OLLAMA_MODEL}")
             return 1
 
-        # Get job listings
+        # Stream job listings so processing starts while later pages load
         logger.info("Starting job search...")
-        job_listings = scraper.get_job_listings()
+        job_listings = scraper.iter_job_listings()
+        if Config.PRIORITIZE_JOBS:
+            prioritizer = JobPrioritizer(
+                store.company_history() if store else None)
+            job_listings = prioritized(job_listings, prioritizer)
 
-        if not job_listings:
-            logger.error(
-                "No job listings found. The website structure might have changed."
-            )
-            return 1
-
-        logger.info(f"Found {len(job_listings)} job listings to process")
+        deadline = None
+        if Config.RUN_TIME_BUDGET_MINUTES > 0:
+            deadline = time.monotonic() + Config.RUN_TIME_BUDGET_MINUTES * 60
 
-        suitable_jobs = []
+        total_found = 0
         processed_count = 0
-        new_jobs_added = 0
 
         for i, job in enumerate(job_listings, 1):
-            try:
+            total_found = i
+            if deadline and time.monotonic() >= deadline:
                 logger.info(
-                    f"Processing job {i}/{len(job_listings)}: {job['title']}")
-
-                # Check if job title contains excluded keywords
-                if is_excluded_job(job['title']):
-                    logger.info(
-                        f"Skipping job (excluded keyword): {job['title']}")
-                    continue
-
-                # Check if job is within date range
-                if not is_within_date_range(job.get('date_posted')):
-                    logger.info(
-                        f"Skipping job (outside date range): {job['title']} - Posted: {job.get('date_posted', 'Unknown')}"
-                    )
-                    continue
-
-                # Get detailed job description
-                job_description = scraper.get_job_description(job['url'])
+                    f"Time budget of {Config.RUN_TIME_BUDGET_MINUTES} minutes reached, stopping"
+                )
+                break
+            set_log_job_id(job.url)
+            try:
+                logger.info(f"Processing job {i}: {job.title}")
 
-                if not job_description:
-                    logger.warning(
-                        f"Could not extract description for: {job['title']}")
+                status = process_job(job, scraper, analyzer, store)
+                if status in (SKIPPED, FETCH_FAILED):
                     continue
 
-                # Analyze with LLM
-                is_suitable, reasoning, full_analysis = analyzer.is_suitable_for_junior(
-                    job['title'], job_description, job.get('company', ''))
-
-                if is_suitable:
-                    logger.info(f"✓ SUITABLE: {job['title']}")
-
-                    # Get the actual application URL instead of the listing URL
-                    application_url = scraper.get_application_url(job['url'])
-
-                    # Add reasoning and application URL to job info
-                    job_with_reasoning = job.copy()
-                    job_with_reasoning['reason'] = reasoning
-                    job_with_reasoning['application_url'] = application_url
-
-                    # Try to save the job (returns True if new, False if duplicate)
-                    if save_suitable_job(application_url, job['title'],
-                                         job_with_reasoning):
-                        suitable_jobs.append(job_with_reasoning)
-                        new_jobs_added += 1
-                        logger.info(f"✓ NEW JOB ADDED: {job['title']}")
-                    else:
-                        logger.info(f"✓ DUPLICATE SKIPPED: {job['title']}")
-                else:
-                    logger.info(f"✗ Not suitable: {job['title']}")
+                # Queue the job for saving (False if it is a duplicate)
+                if status == SUITABLE and not writer.add(job):
+                    logger.info(f"✓ DUPLICATE SKIPPED: {job.title}")
 
                 processed_count += 1
 
-                # Add delay between requests to be respectful
-                time.sleep(Config.DELAY_BETWEEN_REQUESTS)
-
             except Exception as e:
-                logger.error(f"Error processing job {job['title']}: {str(e)}")
+                logger.error(f"Error processing job {job.title}: {str(e)}")
                 continue
 
+        set_log_job_id(None)
+
+        # Count only the jobs actually written
+        new_jobs_added = writer.close()
+        suitable_jobs = writer.saved_jobs
+
+        if not total_found:
+            logger.error(
+                "No job listings found. The website structure might have changed."
+            )
+            return 1
+
         # Summary
         logger.info("=" * 60)
         logger.info("SEARCH COMPLETE")
-        logger.info(f"Total jobs found: {len(job_listings)}")
+        logger.info(f"Total jobs found: {total_found}")
         logger.info(f"Jobs processed: {processed_count}")
         logger.info(f"Suitable jobs found: {len(suitable_jobs)}")
         logger.info(f"New jobs added to CSV: {new_jobs_added}")
-        logger.info(f"Results saved to: {Config.OUTPUT_FILE}")
+        logger.info(f"Results saved to: {', '.join(writer.paths)}")
         logger.info("=" * 60)
 
         # Print suitable jobs summary
         if suitable_jobs:
             print(f"\n🎉 NEW SUITABLE JOBS FOUND: {new_jobs_added}")
             for job in suitable_jobs:
-                print(f"• {job['title']}")
+                print(f"• {job.title}")
                 # Show application URL if available, otherwise listing URL
-                display_url = job.get('application_url', job['url'])
+                display_url = job.application_url or job.url
                 print(f"  Apply: {display_url}")
-                if job.get('company'):
-                    print(f"  Company: {job['company']}")
-                if job.get('location'):
-                    print(f"  Location: {job['location']}")
+                if job.company:
+                    print(f"  Company: {job.company}")
+                if job.location:
+                    print(f"  Location: {job.location}")
                 print()
         elif new_jobs_added == 0:
             print("\n📝 No new jobs found (all suitable jobs were duplicates)")
@@ -155,7 +154,237 @@ def main():
         logger.error(f"Unexpected error: {str(e)}")
         return 1
     finally:
+        if job_listings is not None:
+            job_listings.close()
+        writer.close()
         scraper.close()
+        if store:
+            store.close()
+
+
+def read_results():
+    """Read the saved suitable jobs from the output CSV"""
+    import csv
+    import os
+
+    if not os.path.exists(Config.OUTPUT_FILE):
+        return []
+
+    with open(Config.OUTPUT_FILE, "r", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def show_stats(args):
+    """Print a summary of the saved results"""
+    from collections import Counter
+
+    rows = read_results()
+    applied = sum(1 for row in rows if row.get('applied', '').strip())
+
+    print(f"Results file: {Config.OUTPUT_FILE}")
+    print(f"Suitable jobs saved: {len(rows)}")
+    print(f"Applied: {applied}")
+    print(f"Not yet applied: {len(rows) - applied}")
+
+    for field, label in (('company', "companies"), ('location',
+                                                      "locations")):
+        counts = Counter(row.get(field) or "Unknown" for row in rows)
+        if counts:
+            print(f"\nTop {label}:")
+            for value, count in counts.most_common(args.top):
+                print(f"  {count:>4}  {value}")
+
+    return 0
+
+
+def export_results(args):
+    """Write the saved results as CSV or JSON to a file or stdout"""
+    import csv
+    import json
+
+    rows = read_results()
+    out = open(args.output, "w", newline="",
+               encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        if args.format == "json":
+            json.dump(rows, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+        elif rows:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if args.output:
+            out.close()
+
+    return 0
+
+
+def reanalyze_jobs(args):
+    """Re-score stored jobs with the current model and prompt, offline
+
+    Descriptions come from the job store, so nothing is scraped. Jobs are
+    analysed concurrently in batches, and the new verdicts are compared with
+    the stored ones.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+    from llm_analyzer import JobAnalyzer
+    from job_store import JobStore
+    from results_writer import ResultsWriter
+
+    setup_logger()
+    if args.model:
+        Config.OLLAMA_MODEL = args.model
+
+    store = JobStore()
+    analyzer = JobAnalyzer()
+    model = Config.OLLAMA_MODEL
+    prompt_version = analyzer.prompt_version()
+
+    def analyze(job):
+        set_log_job_id(job.url)
+        return job, analyzer.is_suitable_for_junior(job.title, job.description,
+                                                    job.company)
+
+    try:
+        if not analyzer.test_connection():
+            logger.error(f"Run: ollama pull {Config.OLLAMA_MODEL}")
+            return 1
+
+        total = store.count()
+        if args.limit:
+            total = min(total, args.limit)
+        logger.info(f"Re-analysing {total} stored jobs with {model} "
+                    f"(prompt {prompt_version}, {args.workers} workers)")
+
+        # Verdicts are applied after the read cursor is exhausted
+        updates = []
+        gained, lost, unchanged, failed = [], [], 0, 0
+        jobs = islice(store.iter_jobs(), total)
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            while True:
+                batch = list(islice(jobs, args.workers * 4))
+                if not batch:
+                    break
+
+                for job, result in executor.map(analyze, batch):
+                    # Free the description once analysed
+                    job.release_description()
+
+                    is_suitable, reasoning, full_analysis = result
+                    if not full_analysis:
+                        failed += 1
+                        continue
+
+                    updates.append(
+                        (job.url, is_suitable, reasoning,
+                         analyzer.parse_confidence(full_analysis)))
+                    if is_suitable and not job.is_suitable:
+                        gained.append(job)
+                    elif job.is_suitable and not is_suitable:
+                        lost.append(job)
+                    else:
+                        unchanged += 1
+        set_log_job_id(None)
+
+        if not args.dry_run:
+            for url, is_suitable, reasoning, confidence in updates:
+                store.update_verdict(url, is_suitable, reasoning, confidence,
+                                     model, prompt_version)
+
+        new_jobs_added = 0
+        if args.save and not args.dry_run:
+            with ResultsWriter() as writer:
+                for job in gained:
+                    writer.add(job)
+            new_jobs_added = len(writer.added)
+
+        print(f"\nRe-analysed {len(updates)} jobs with {model} "
+              f"(prompt {prompt_version})")
+        print(f"Unchanged verdicts: {unchanged}")
+        print(f"Now suitable: {len(gained)}")
+        for job in gained:
+            print(f"  + {job.title} ({job.company or 'Unknown'})")
+        print(f"No longer suitable: {len(lost)}")
+        for job in lost:
+            print(f"  - {job.title} ({job.company or 'Unknown'})")
+        if failed:
+            print(f"Analysis failed: {failed}")
+        if args.save and not args.dry_run:
+            print(f"New jobs added to CSV: {new_jobs_added}")
+        if args.dry_run:
+            print("Dry run: stored verdicts were not updated")
+
+        return 0
+
+    finally:
+        store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="UK Job Hunt - Software Engineering Jobs Scraper")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("run",
+                          help="Scrape, analyse and save suitable jobs")
+
+    stats = subparsers.add_parser("stats",
+                                  help="Summarise the saved results")
+    stats.add_argument("--top",
+                       type=int,
+                       default=10,
+                       help="Number of companies/locations to list")
+
+    export = subparsers.add_parser("export",
+                                   help="Export the saved results")
+    export.add_argument("--format", choices=["csv", "json"], default="json")
+    export.add_argument("--output", help="Output file (default: stdout)")
+
+    reanalyze = subparsers.add_parser(
+        "reanalyze", help="Re-score stored jobs without re-scraping")
+    reanalyze.add_argument("--model",
+                           help="Ollama model (default: OLLAMA_MODEL)")
+    reanalyze.add_argument("--workers",
+                           type=int,
+                           default=Config.REANALYZE_WORKERS,
+                           help="Concurrent LLM requests")
+    reanalyze.add_argument("--limit",
+                           type=int,
+                           help="Only re-analyse this many jobs")
+    reanalyze.add_argument("--save",
+                           action="store_true",
+                           help="Add newly suitable jobs to the output CSV")
+    reanalyze.add_argument("--dry-run",
+                           action="store_true",
+                           help="Show the diff without updating the store")
+
+    # Listed for --help only; their arguments go to their own parsers below
+    subparsers.add_parser("watch", help="Poll for new jobs on a schedule")
+    subparsers.add_parser("shard", help="Split a run across processes")
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "watch":
+        import daemon
+        return daemon.main(argv[1:])
+    if argv and argv[0] == "shard":
+        import shard
+        return shard.main(argv[1:])
+
+    args = parser.parse_args(argv)
+
+    if args.command in (None, "run"):
+        return run_search()
+    if args.command == "stats":
+        return show_stats(args)
+    if args.command == "export":
+        return export_results(args)
+    if args.command == "reanalyze":
+        return reanalyze_jobs(args)
 
 
 if __name__ == "__main__":
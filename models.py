@@ -0,0 +1,64 @@
+import sys
+from dates import to_date
+
+
+class Job:
+    """A job posting as it moves from listing through LLM verdict
+
+    Uses __slots__ instead of a per-instance dict, and interns company and
+    location strings (a crawl sees the same few hundred of each thousands of
+    times). The description is only held while the job is being analysed;
+    call release_description() once it has been used.
+    """
+
+    __slots__ = ('title', 'url', 'company', 'location', 'date_posted',
+                 'raw_date_text', 'description', 'is_suitable', 'confidence',
+                 'reasoning', 'application_url')
+
+    def __init__(self,
+                 title,
+                 url,
+                 company="",
+                 location="",
+                 date_posted=None,
+                 raw_date_text="",
+                 description=None,
+                 is_suitable=None,
+                 confidence="",
+                 reasoning="",
+                 application_url=""):
+        self.title = title
+        self.url = url
+        self.company = sys.intern(company) if company else ""
+        self.location = sys.intern(location) if location else ""
+        self.date_posted = date_posted
+        self.raw_date_text = sys.intern(
+            raw_date_text) if raw_date_text else ""
+        self.description = description
+        self.is_suitable = is_suitable
+        self.confidence = confidence
+        self.reasoning = reasoning
+        self.application_url = application_url
+
+    def __repr__(self):
+        return f"Job({self.title!r}, {self.url!r})"
+
+    def release_description(self):
+        """Drop the description once it is no longer needed"""
+        self.description = None
+
+    def to_dict(self):
+        """Plain dict for JSON serialization (dates as YYYY-MM-DD)"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if self.date_posted:
+            data['date_posted'] = self.date_posted.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        fields = {
+            name: data[name]
+            for name in cls.__slots__ if data.get(name) is not None
+        }
+        fields['date_posted'] = to_date(data.get('date_posted'))
+        return cls(**fields)
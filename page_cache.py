@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import sqlite3
+import time
+import urllib.parse
+import zlib
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text):
+    """Stable hash of page content used for change detection"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """On-disk cache of job detail pages keyed by job URL
+
+    Each entry keeps the rendered page body (compressed), the extracted
+    description, the HTTP validators (ETag/Last-Modified) and a hash of the
+    description. The hash of the description last sent to the LLM is stored
+    alongside it so callers can tell whether a posting changed since then.
+    Whether each host sends validators at all is recorded too, so sites that
+    never answer conditional requests are not probed for every new page.
+    """
+
+    def __init__(self, path=None, max_age_hours=None):
+        self.path = path or Config.PAGE_CACHE_FILE
+        if max_age_hours is None:
+            max_age_hours = Config.PAGE_CACHE_MAX_AGE_HOURS
+        self.max_age_seconds = max_age_hours * 3600
+
+        # Generous timeout: shard workers on one host share the cache file
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                body BLOB,
+                description BLOB,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                analyzed_hash TEXT,
+                fetched_at REAL
+            )""")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS hosts (
+                host TEXT PRIMARY KEY,
+                sends_validators INTEGER,
+                checked_at REAL
+            )""")
+        self.conn.commit()
+
+    def get(self, url):
+        """Return the cached entry for a URL as a dict, or None"""
+        row = self.conn.execute(
+            "SELECT body, description, etag, last_modified, content_hash, "
+            "analyzed_hash, fetched_at FROM pages WHERE url = ?",
+            (url, )).fetchone()
+        if not row:
+            return None
+
+        body, description, etag, last_modified, digest, analyzed, fetched = row
+        return {
+            'url': url,
+            'body': zlib.decompress(body).decode("utf-8") if body else "",
+            'description': zlib.decompress(description).decode("utf-8"),
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': digest,
+            'analyzed_hash': analyzed,
+            'fetched_at': fetched
+        }
+
+    def is_fresh(self, entry):
+        """Check if an entry is recent enough to use without revalidating"""
+        return time.time() - entry['fetched_at'] < self.max_age_seconds
+
+    def conditional_headers(self, entry):
+        """Build If-None-Match/If-Modified-Since headers for an entry"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def sends_validators(self, url):
+        """Whether the URL's host sent validators when last probed
+
+        Returns None if the host hasn't been probed within the freshness
+        window, so a site that starts sending them is noticed again.
+        """
+        row = self.conn.execute(
+            "SELECT sends_validators, checked_at FROM hosts WHERE host = ?",
+            (urllib.parse.urlsplit(url).netloc, )).fetchone()
+        if not row or time.time() - row[1] >= self.max_age_seconds:
+            return None
+        return bool(row[0])
+
+    def record_validators(self, url, sent):
+        """Record whether a probe of the URL's host returned validators"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO hosts (host, sends_validators, checked_at) "
+            "VALUES (?, ?, ?)",
+            (urllib.parse.urlsplit(url).netloc, int(sent), time.time()))
+        self.conn.commit()
+
+    def store(self, url, body, description, etag=None, last_modified=None):
+        """Store a freshly fetched page, keeping the last analysed hash"""
+        self.conn.execute(
+            """
+            INSERT INTO pages (url, body, description, etag, last_modified,
+                               content_hash, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                body = excluded.body,
+                description = excluded.description,
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash,
+                fetched_at = excluded.fetched_at
+            """, (url, zlib.compress(body.encode("utf-8")),
+                  zlib.compress(description.encode("utf-8")), etag,
+                  last_modified, content_hash(description), time.time()))
+        self.conn.commit()
+        return self.get(url)
+
+    def touch(self, url):
+        """Mark an entry as revalidated (e.g. after a 304 response)"""
+        self.conn.execute("UPDATE pages SET fetched_at = ? WHERE url = ?",
+                          (time.time(), url))
+        self.conn.commit()
+
+    def mark_analyzed(self, url):
+        """Record that the current description for a URL has been analysed"""
+        self.conn.execute(
+            "UPDATE pages SET analyzed_hash = content_hash WHERE url = ?",
+            (url, ))
+        self.conn.commit()
+
+    def has_changed(self, entry):
+        """Check if an entry's description differs from the last analysed one"""
+        return entry['content_hash'] != entry['analyzed_hash']
+
+    def close(self):
+        self.conn.close()
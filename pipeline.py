@@ -0,0 +1,76 @@
+import logging
+from config import Config
+from utils import is_excluded_job, is_within_date_range
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of process_job
+SKIPPED = "skipped"
+FETCH_FAILED = "fetch_failed"
+NOT_SUITABLE = "not_suitable"
+SUITABLE = "suitable"
+
+
+def process_job(job, scraper, analyzer, store=None):
+    """Filter, fetch and analyse a single job listing
+
+    Returns SKIPPED if the job was filtered out, FETCH_FAILED if no
+    description could be fetched (worth retrying later), otherwise
+    NOT_SUITABLE or SUITABLE. The verdict, reasoning and (for
+    suitable jobs) application URL are set on the Job. If a JobStore is
+    given, the description and verdict are saved to it. The description is
+    released before returning.
+
+    Suitable jobs are not marked as analysed in the page cache: the caller
+    calls scraper.mark_description_analyzed() once the job has been saved,
+    so a job lost before saving is analysed again on the next run.
+    """
+    # Check if job title contains excluded keywords
+    if is_excluded_job(job.title):
+        logger.info(f"Skipping job (excluded keyword): {job.title}")
+        return SKIPPED
+
+    # Check if job is within date range
+    if not is_within_date_range(job.date_posted):
+        logger.info(
+            f"Skipping job (outside date range): {job.title} - Posted: {job.date_posted or 'Unknown'}"
+        )
+        return SKIPPED
+
+    # Get detailed job description
+    job.description, changed = scraper.fetch_job_description(job.url)
+
+    if not job.description:
+        logger.warning(f"Could not extract description for: {job.title}")
+        return FETCH_FAILED
+
+    if not changed and Config.SKIP_UNCHANGED_JOBS:
+        logger.info(
+            f"Skipping job (unchanged since last analysis): {job.title}")
+        job.release_description()
+        return SKIPPED
+
+    # Analyze with LLM
+    job.is_suitable, job.reasoning, full_analysis = analyzer.is_suitable_for_junior(
+        job.title, job.description, job.company)
+    if full_analysis:
+        job.confidence = analyzer.parse_confidence(full_analysis)
+        if store:
+            store.save_analysis(job, Config.OLLAMA_MODEL,
+                                analyzer.prompt_version())
+    job.release_description()
+
+    if not job.is_suitable:
+        if full_analysis:
+            scraper.mark_description_analyzed(job.url)
+        logger.info(f"✗ Not suitable: {job.title}")
+        return NOT_SUITABLE
+
+    logger.info(f"✓ SUITABLE: {job.title}")
+
+    # Get the actual application URL instead of the listing URL
+    job.application_url = scraper.get_application_url(job.url)
+    if store:
+        store.set_application_url(job.url, job.application_url)
+
+    return SUITABLE
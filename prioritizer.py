@@ -0,0 +1,88 @@
+import heapq
+import itertools
+import logging
+from config import Config
+from dates import get_date_window
+from utils import is_excluded_job
+
+logger = logging.getLogger(__name__)
+
+# Title words that suggest a junior-friendly role, with their score weight
+TITLE_SIGNALS = {
+    "graduate": 3.0,
+    "junior": 3.0,
+    "entry": 2.5,
+    "early career": 2.5,
+    "trainee": 2.0,
+    "apprentice": 1.5,
+    "associate": 1.0,
+    "intern": 1.0
+}
+RECENCY_WEIGHT = 2.0
+SPONSOR_WEIGHT = 2.0
+
+
+class JobPrioritizer:
+    """Score jobs by how likely they are to be suitable, before fetching them
+
+    The score combines junior-level title signals, how recently the job was
+    posted and the share of the company's stored jobs that were judged
+    suitable (smoothed, so companies with no history score neutrally).
+    """
+
+    def __init__(self, company_history=None, today=None):
+        # company -> (suitable, total) from the job store
+        self.company_history = company_history or {}
+        self.today = today or get_date_window().today
+
+    def score(self, job):
+        if is_excluded_job(job.title):
+            # Filtered out without a fetch anyway, so order doesn't matter
+            return float("-inf")
+
+        title = job.title.lower()
+        score = sum(weight for signal, weight in TITLE_SIGNALS.items()
+                    if signal in title)
+
+        if job.date_posted:
+            age_days = (self.today - job.date_posted).days
+            score += RECENCY_WEIGHT * max(
+                0.0, 1 - age_days / max(Config.MAX_JOB_AGE_DAYS, 1))
+        else:
+            score += RECENCY_WEIGHT / 2
+
+        suitable, total = self.company_history.get(job.company, (0, 0))
+        # Laplace smoothing: no history gives 0.5, the same as a 1-in-2 record
+        score += SPONSOR_WEIGHT * (suitable + 1) / (total + 2)
+
+        return score
+
+
+def prioritized(jobs, prioritizer, window=None):
+    """Yield jobs highest score first, from a bounded lookahead window
+
+    Up to `window` jobs are buffered in a heap and the best is released as
+    each new job arrives, so a streamed listing still starts processing
+    before every page has been scraped. The default is PRIORITY_WINDOW,
+    capped at half of MAX_JOBS_TO_PROCESS (a window as large as the job
+    limit would hold everything back until the listing ends). Closing this
+    generator closes the underlying one.
+    """
+    if window is None:
+        window = min(Config.PRIORITY_WINDOW,
+                     max(Config.MAX_JOBS_TO_PROCESS // 2, 1))
+
+    heap = []
+    order = itertools.count()  # Ties keep listing order
+    try:
+        for job in jobs:
+            heapq.heappush(heap, (-prioritizer.score(job), next(order), job))
+            if len(heap) >= window:
+                yield heapq.heappop(heap)[2]
+
+        while heap:
+            yield heapq.heappop(heap)[2]
+    finally:
+        close = getattr(jobs, "close", None)
+        if close:
+            close()
@@ -0,0 +1,176 @@
+import random
+import threading
+import time
+import logging
+import urllib.parse
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "slow down and try again"
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TransientFetchError(Exception):
+    """A fetch failed in a way that is worth retrying (timeouts, 429, 5xx)"""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can be changed while in use"""
+
+    def __init__(self, rate, capacity=1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how long the caller must wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+
+            wait = 0.0
+            if self.tokens < 0:
+                wait = -self.tokens / self.rate
+            return max(wait, self.paused_until - now)
+
+    def pause(self, seconds):
+        """Hold back all requests for the given number of seconds"""
+        with self.lock:
+            self.paused_until = max(self.paused_until,
+                                    time.monotonic() + seconds)
+
+
+class AdaptiveRateLimiter:
+    """Per-host rate limiter that adapts to server responses
+
+    Each host gets a token bucket starting at RATE_LIMIT_RPS. Fast responses
+    raise the rate additively up to RATE_LIMIT_MAX_RPS; slow responses and
+    429/5xx errors cut it multiplicatively down to RATE_LIMIT_MIN_RPS.
+    Transient failures are retried with jittered exponential backoff, limited
+    per request by MAX_RETRIES and per run by RETRY_BUDGET.
+    """
+
+    def __init__(self,
+                 rate=None,
+                 min_rate=None,
+                 max_rate=None,
+                 target_latency=None,
+                 max_retries=None,
+                 retry_budget=None):
+        self.initial_rate = rate or Config.RATE_LIMIT_RPS
+        self.min_rate = min_rate or Config.RATE_LIMIT_MIN_RPS
+        self.max_rate = max_rate or Config.RATE_LIMIT_MAX_RPS
+        self.target_latency = target_latency or Config.RATE_LIMIT_TARGET_LATENCY
+        self.max_retries = (Config.MAX_RETRIES
+                            if max_retries is None else max_retries)
+        self.retry_budget = (Config.RETRY_BUDGET
+                             if retry_budget is None else retry_budget)
+        self.increase_step = self.initial_rate * 0.1
+        self.buckets = {}
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+        self.budget_used = 0
+
+    def _bucket(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.initial_rate)
+            return self.buckets[host]
+
+    def acquire(self, url):
+        """Block until a request to this URL's host is allowed"""
+        wait = self._bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        with self.lock:
+            self.stats['requests'] += 1
+
+    def record_success(self, url, elapsed):
+        """Adjust the host's rate after a successful request"""
+        bucket = self._bucket(url)
+        with bucket.lock:
+            if elapsed <= self.target_latency:
+                bucket.rate = min(self.max_rate,
+                                  bucket.rate + self.increase_step)
+            elif elapsed > 2 * self.target_latency:
+                bucket.rate = max(self.min_rate, bucket.rate * 0.75)
+
+    def record_failure(self, url, retry_after=None):
+        """Back off the host's rate after a throttled or failed request"""
+        bucket = self._bucket(url)
+        with bucket.lock:
+            bucket.rate = max(self.min_rate, bucket.rate * 0.5)
+        if retry_after:
+            bucket.pause(retry_after)
+        with self.lock:
+            self.stats['failures'] += 1
+
+    def backoff_delay(self, attempt):
+        """Full-jitter exponential backoff for the given retry attempt"""
+        ceiling = min(Config.BACKOFF_MAX, Config.BACKOFF_BASE * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def _take_retry(self):
+        with self.lock:
+            if self.budget_used >= self.retry_budget:
+                return False
+            self.budget_used += 1
+            self.stats['retries'] += 1
+            return True
+
+    def reset_budget(self):
+        """Start a new run's RETRY_BUDGET (stats keep accumulating)"""
+        with self.lock:
+            self.budget_used = 0
+
+    def call(self, url, func, *args, **kwargs):
+        """Rate-limit func, retrying on TransientFetchError
+
+        Re-raises the last TransientFetchError once retries for this request
+        or the run's retry budget are exhausted.
+        """
+        attempt = 0
+        while True:
+            self.acquire(url)
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except TransientFetchError as e:
+                self.record_failure(url, e.retry_after)
+                if attempt >= self.max_retries or not self._take_retry():
+                    raise
+
+                delay = max(self.backoff_delay(attempt), e.retry_after or 0)
+                logger.warning(
+                    f"Transient error fetching {url} ({e}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.record_success(url, time.monotonic() - start)
+            return result
+
+    def current_rate(self, url):
+        return self._bucket(url).rate
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,315 @@
+import csv
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from config import Config
+from utils import file_lock, load_existing_jobs
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = ['job_title', 'location', 'job_url', 'company', 'applied']
+
+
+def result_row(job, job_url=None):
+    """Output row for a suitable job"""
+    return {
+        'job_title': job.title,
+        'location': job.location,
+        'job_url': job_url or job.application_url or job.url,
+        'company': job.company,
+        'applied': ''  # Empty by default for user to fill in
+    }
+
+
+def row_key(row):
+    """Duplicate key for a result row: (title, company)"""
+    return (row['job_title'].strip(), row['company'].strip())
+
+
+def _fsync_dir(directory):
+    """Persist a rename by syncing its directory (not possible on Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, write, keep_existing=False):
+    """Write a file via a temp file, fsync and os.replace
+
+    write(f) writes to the temp file (opened in binary mode). With
+    keep_existing, the current contents of `path` are copied in first, so
+    appends never leave a partial row in `path` if the process dies.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory,
+                                     prefix=".",
+                                     suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+                if keep_existing:
+                    with open(path, "rb") as existing:
+                        shutil.copyfileobj(existing, f)
+            else:
+                os.chmod(temp_path, 0o644)
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    _fsync_dir(directory)
+
+
+class CsvOutput:
+    """Results appended to a CSV file (the file users mark as applied)"""
+
+    extension = ".csv"
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, rows):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=RESULT_FIELDS)
+        if not os.path.exists(self.path) or not os.path.getsize(self.path):
+            writer.writeheader()
+        writer.writerows(rows)
+        data = buffer.getvalue().encode("utf-8")
+        atomic_write(self.path, lambda f: f.write(data), keep_existing=True)
+
+
+class JsonLinesOutput:
+    """Results appended to a JSON Lines file, one object per job"""
+
+    extension = ".jsonl"
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, rows):
+        data = "".join(
+            json.dumps(row, ensure_ascii=False) + "\n"
+            for row in rows).encode("utf-8")
+        atomic_write(self.path, lambda f: f.write(data), keep_existing=True)
+
+
+class SqliteOutput:
+    """Results inserted into a SQLite table, one transaction per batch"""
+
+    extension = ".db"
+
+    def __init__(self, path):
+        self.path = path
+        conn = sqlite3.connect(self.path, timeout=30)
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    job_title TEXT,
+                    location TEXT,
+                    job_url TEXT,
+                    company TEXT,
+                    applied TEXT,
+                    added_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (job_title, company)
+                )""")
+        conn.close()
+
+    def write(self, rows):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO results (job_title, location, "
+                    "job_url, company, applied) VALUES (?, ?, ?, ?, ?)",
+                    [tuple(row[field] for field in RESULT_FIELDS)
+                     for row in rows])
+        finally:
+            conn.close()
+
+
+class ParquetOutput:
+    """Results in a Parquet file (requires pyarrow)
+
+    Parquet files can't be appended to, so each batch rewrites the file
+    (existing rows plus the new ones) through a temp file.
+    """
+
+    extension = ".parquet"
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet output requires pyarrow: pip install pyarrow")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.schema = pyarrow.schema([(field, pyarrow.string())
+                                      for field in RESULT_FIELDS])
+
+    def write(self, rows):
+        table = self.pa.Table.from_pylist(rows, schema=self.schema)
+        if os.path.exists(self.path):
+            table = self.pa.concat_tables(
+                [self.pq.read_table(self.path, schema=self.schema), table])
+        atomic_write(self.path, lambda f: self.pq.write_table(table, f))
+
+
+OUTPUT_TYPES = {
+    "csv": CsvOutput,
+    "jsonl": JsonLinesOutput,
+    "sqlite": SqliteOutput,
+    "parquet": ParquetOutput
+}
+
+
+def output_path(format_name):
+    """File for a format: OUTPUT_FILE with the format's extension"""
+    if format_name == "csv":
+        return Config.OUTPUT_FILE
+    base = os.path.splitext(Config.OUTPUT_FILE)[0]
+    return base + OUTPUT_TYPES[format_name].extension
+
+
+class ResultsWriter:
+    """Buffered, de-duplicated writer of suitable jobs to every output format
+
+    Jobs are buffered and written in batches of OUTPUT_BATCH_SIZE to the CSV
+    output (always written: it is the duplicate index and the file users
+    mark as applied) and to each extra format in OUTPUT_FORMATS. Each write
+    is atomic, so a crash never leaves a partial row. Buffered jobs are lost
+    on a crash, so `on_saved(url)` is called for each job only once it is in
+    the CSV (written, or found there already); use it to record anything
+    that would stop the job being found again (e.g. the page cache's
+    analysed mark). close() flushes and rewrites NEW_JOBS_FILE with the jobs
+    added by this run, so consumers can read only the latest delta.
+    """
+
+    def __init__(self,
+                 formats=None,
+                 batch_size=None,
+                 new_jobs_file=None,
+                 existing_jobs=None,
+                 on_saved=None):
+        formats = Config.OUTPUT_FORMATS if formats is None else formats
+        self.batch_size = batch_size or Config.OUTPUT_BATCH_SIZE
+        self.new_jobs_file = (Config.NEW_JOBS_FILE
+                              if new_jobs_file is None else new_jobs_file)
+        self.existing_jobs = (load_existing_jobs()
+                              if existing_jobs is None else existing_jobs)
+        self.on_saved = on_saved
+
+        self.outputs = [CsvOutput(Config.OUTPUT_FILE)]
+        for format_name in dict.fromkeys(formats):
+            if format_name == "csv":
+                continue
+            if format_name not in OUTPUT_TYPES:
+                logger.warning(f"Unknown output format: {format_name}")
+                continue
+            try:
+                self.outputs.append(OUTPUT_TYPES[format_name](
+                    output_path(format_name)))
+            except ImportError as e:
+                logger.error(f"Skipping {format_name} output: {e}")
+
+        self.pending = []  # (row, job) pairs
+        self.pending_duplicates = []  # Duplicates of queued jobs
+        self.added = []  # Rows written by this writer
+        self.saved_jobs = []  # Jobs whose rows were written
+        self.closed = False
+
+    @property
+    def paths(self):
+        return [output.path for output in self.outputs]
+
+    def add(self, job, job_url=None):
+        """Queue a suitable job; returns False if it is already saved
+
+        A queued job is only counted as added once flush() has written it
+        (see `added` and close()).
+        """
+        row = result_row(job, job_url)
+        key = row_key(row)
+        if key in self.existing_jobs:
+            logger.info(f"Skipping duplicate job: {job.title} at {job.company}")
+            if any(row_key(queued) == key for queued, _ in self.pending):
+                # Only saved once the queued copy is flushed
+                self.pending_duplicates.append(job)
+            else:
+                self._saved(job)
+            return False
+
+        self.existing_jobs.add(key)
+        self.pending.append((row, job))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        return True
+
+    def flush(self):
+        """Write buffered jobs to every output"""
+        if not self.pending:
+            return
+
+        with file_lock(Config.OUTPUT_FILE):
+            # Another process may have saved some of these since add()
+            on_disk = load_existing_jobs()
+            written = [(row, job) for row, job in self.pending
+                       if row_key(row) not in on_disk]
+            rows = [row for row, _ in written]
+            if rows:
+                # The CSV is the duplicate index, so its errors propagate
+                self.outputs[0].write(rows)
+                for output in self.outputs[1:]:
+                    try:
+                        output.write(rows)
+                    except Exception as e:
+                        logger.error(
+                            f"Error writing results to {output.path}: {e}")
+
+        for row, job in written:
+            logger.info(f"✓ NEW JOB ADDED: {job.title}")
+            self.added.append(row)
+            self.saved_jobs.append(job)
+        for _, job in self.pending:
+            self._saved(job)
+        for job in self.pending_duplicates:
+            self._saved(job)
+        self.pending = []
+        self.pending_duplicates = []
+
+    def _saved(self, job):
+        if self.on_saved:
+            self.on_saved(job.url)
+
+    def close(self):
+        """Flush, write the new-since-last-run file and return jobs added"""
+        if not self.closed:
+            self.flush()
+            if self.new_jobs_file:
+                data = "".join(
+                    json.dumps(row, ensure_ascii=False) + "\n"
+                    for row in self.added).encode("utf-8")
+                atomic_write(self.new_jobs_file, lambda f: f.write(data))
+            self.closed = True
+        return len(self.added)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,19 +1,51 @@
 import requests
 import time
+import logging
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from config import Config
-from utils import setup_logger, clean_text
+from utils import clean_text
+from dates import parse_posted_date
+from models import Job
+from page_cache import PageCache
+from rate_limiter import AdaptiveRateLimiter, TransientFetchError, RETRYABLE_STATUSES, parse_retry_after
+from selector_engine import SelectorResolver, CONFIRM_AFTER, row_fingerprint, page_fingerprint
+import re
 import urllib.parse
 
-logger = setup_logger()
+logger = logging.getLogger(__name__)
+
+# Browser error pages for throttling/server errors (status code in the title)
+ERROR_PAGE_TITLE = re.compile(
+    r'^\s*(429|50[0234])\b|too many requests|service unavailable',
+    re.IGNORECASE)
+
+# Fallback candidates for each field, most specific first. The resolver
+# remembers which selector or column position matched for each page layout.
+LISTING_ROW_SCOPE = "listing rows"
+DETAIL_PAGE_SCOPE = "job pages"
+TITLE_SELECTORS = [
+    'td.css-1c5obzm > div > a', 'td:first-child a[href]', 'a[href]'
+]
+COMPANY_COLUMNS = [2, 3, 4]
+LOCATION_COLUMNS = [3, 4, 5]
+DATE_SELECTORS = ['td.css-xumdn4', 'td:last-child']
+DESCRIPTION_SELECTORS = [
+    '.job-description', '.description', '.job-content', '.content',
+    '.job-details', '.details', 'main', '.main-content',
+    '[class*="description"]', '[class*="content"]'
+]
+# Not a selector: the page's main/body text, used when no selector matches.
+# Listed as the last candidate so layouts without a description element
+# learn it and skip the cascade too.
+PAGE_TEXT = "<main or body text>"
 
 
 class JobScraper:
@@ -22,9 +54,23 @@ class JobScraper:
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': Config.USER_AGENT})
         self.driver = None
+        self.listing_driver = None
+        self.rate_limiter = AdaptiveRateLimiter()
+        self.page_cache = PageCache() if Config.PAGE_CACHE_ENABLED else None
+        self.selectors = SelectorResolver()
 
     def setup_driver(self):
         """Setup Chrome WebDriver"""
+        self.driver = self._create_driver()
+        return self.driver
+
+    def setup_listing_driver(self):
+        """Setup a separate Chrome WebDriver for paginating search results"""
+        self.listing_driver = self._create_driver()
+        return self.listing_driver
+
+    def _create_driver(self):
+        """Create a Chrome WebDriver instance"""
         chrome_options = Options()
         if Config.HEADLESS_BROWSER:
             chrome_options.add_argument("--headless")
@@ -37,8 +83,8 @@ class JobScraper:
         try:
             # Use system chromedriver if available
             service = Service("/opt/homebrew/bin/chromedriver")
-            self.driver = webdriver.Chrome(service=service,
-                                           options=chrome_options)
+            driver = webdriver.Chrome(service=service,
+                                      options=chrome_options)
             logger.info("Using system chromedriver")
         except Exception as e:
             logger.info(
@@ -57,42 +103,52 @@ class JobScraper:
                 os.chmod(driver_path, 0o755)
 
                 service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service,
-                                               options=chrome_options)
+                driver = webdriver.Chrome(service=service,
+                                          options=chrome_options)
                 logger.info(f"Using downloaded chromedriver: {driver_path}")
             except Exception as e2:
                 logger.error(f"ChromeDriverManager also failed: {e2}")
                 raise
-        return self.driver
+        return driver
 
     def get_job_listings(self):
         """Scrape job listings from the search page with pagination support"""
+        return list(self.iter_job_listings())
+
+    def iter_job_listings(self, limit=None):
+        """Yield job listings as each results page is parsed
+
+        Pagination uses its own browser (listing_driver) so callers can fetch
+        job details with self.driver between yields. Stops after `limit` jobs
+        (MAX_JOBS_TO_PROCESS by default); close the generator to stop early.
+        """
+        if limit is None:
+            limit = Config.MAX_JOBS_TO_PROCESS
+
         logger.info(f"Fetching job listings from: {Config.SEARCH_URL}")
 
         try:
-            if not self.driver:
-                self.setup_driver()
+            if not self.listing_driver:
+                self.setup_listing_driver()
 
-            self.driver.get(Config.SEARCH_URL)
-
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body")))
+            driver = self.listing_driver
+            self.rate_limiter.call(Config.SEARCH_URL, self._load_page, driver,
+                                   Config.SEARCH_URL)
 
             time.sleep(3)  # Additional wait for dynamic content
 
             # Find job listings using the specific table structure with pagination
-            job_listings = []
+            jobs_found = 0
             page_number = 1
             next_button_selector = "body > div.css-py5jdu > div.css-33z2be > div.chakra-stack.css-1old6bn > button:nth-child(2)"
             job_table_selector = "body > div.css-py5jdu > div.css-33z2be > div.chakra-table__container.css-zipzvv > table > tbody > tr"
 
-            while len(job_listings) < Config.MAX_JOBS_TO_PROCESS:
+            while jobs_found < limit:
                 logger.info(f"Processing page {page_number}...")
 
                 # Wait for table to load
                 try:
-                    WebDriverWait(self.driver, 10).until(
+                    WebDriverWait(driver, 10).until(
                         EC.presence_of_element_located(
                             (By.CSS_SELECTOR, "table tbody")))
                     time.sleep(2)  # Additional wait for content to stabilize
@@ -100,7 +156,7 @@ class JobScraper:
                     logger.warning(f"Table not found on page {page_number}")
                     break
 
-                soup = BeautifulSoup(self.driver.page_source, 'html5lib')
+                soup = BeautifulSoup(driver.page_source, 'html5lib')
                 job_rows = soup.select(job_table_selector)
 
                 if not job_rows:
@@ -113,40 +169,40 @@ class JobScraper:
                 # Process jobs on current page
                 jobs_on_page = 0
                 for row in job_rows:
-                    if len(job_listings) >= Config.MAX_JOBS_TO_PROCESS:
+                    if jobs_found >= limit:
                         break
 
                     job_info = self._extract_job_info_from_table_row(row)
                     if job_info:
-                        job_listings.append(job_info)
+                        jobs_found += 1
                         jobs_on_page += 1
+                        yield job_info
 
                 logger.info(
                     f"Extracted {jobs_on_page} valid jobs from page {page_number}"
                 )
 
                 # Check if we've reached the limit
-                if len(job_listings) >= Config.MAX_JOBS_TO_PROCESS:
-                    logger.info(
-                        f"Reached maximum job limit ({Config.MAX_JOBS_TO_PROCESS})"
-                    )
+                if jobs_found >= limit:
+                    logger.info(f"Reached maximum job limit ({limit})")
                     break
 
                 # Try to find and click the next button
                 try:
-                    next_button = self.driver.find_element(
+                    next_button = driver.find_element(
                         By.CSS_SELECTOR, next_button_selector)
 
                     # Check if button is clickable (not disabled)
                     if next_button.is_enabled() and next_button.is_displayed():
                         # Scroll to button to ensure it's visible
-                        self.driver.execute_script(
+                        driver.execute_script(
                             "arguments[0].scrollIntoView(true);", next_button)
                         time.sleep(1)
 
                         logger.info(
                             f"Clicking next page button for page {page_number + 1}"
                         )
+                        self.rate_limiter.acquire(Config.SEARCH_URL)
                         next_button.click()
 
                         # Wait for page to load
@@ -155,11 +211,9 @@ class JobScraper:
 
                         # Additional wait to ensure new content is loaded
                         try:
-                            WebDriverWait(self.driver,
-                                          10).until(lambda driver: len(
-                                              driver.find_elements(
-                                                  By.CSS_SELECTOR,
-                                                  job_table_selector)) > 0)
+                            WebDriverWait(driver, 10).until(lambda d: len(
+                                d.find_elements(By.CSS_SELECTOR,
+                                                job_table_selector)) > 0)
                         except TimeoutException:
                             logger.warning(
                                 "New page content not loaded in time")
@@ -179,13 +233,12 @@ class JobScraper:
                     break
 
             logger.info(
-                f"Found {len(job_listings)} total job listings across {page_number} pages"
+                f"Found {jobs_found} total job listings across {page_number} pages"
             )
-            return job_listings
+            logger.info(f"Selector cache: {self.selectors.summary()}")
 
         except Exception as e:
             logger.error(f"Error fetching job listings: {str(e)}")
-            return []
 
     def _extract_job_info(self, element):
         """Extract job information from a job listing element"""
@@ -232,13 +285,7 @@ class JobScraper:
                     break
 
             if title and job_url:
-                return {
-                    'title': title,
-                    'url': job_url,
-                    'company': company,
-                    'location': location,
-                    'date_posted': ''
-                }
+                return Job(title, job_url, company, location)
 
         except Exception as e:
             logger.debug(f"Error extracting job info: {str(e)}")
@@ -246,76 +293,80 @@ class JobScraper:
         return None
 
     def _extract_job_info_from_table_row(self, row_element):
-        """Extract job information from a table row element with specific selectors"""
+        """Extract job information from a table row element
+
+        Each field is resolved through a list of fallback selectors (or column
+        positions); the one that matched is cached per row layout and tried
+        first on later rows. Company and location are matched by content, so
+        a column is only cached once it has won several rows in a row.
+        """
         try:
-            # Extract job title and URL using the specific selector you provided
-            title_div = row_element.select_one(
-                'td.css-1c5obzm > div > a > div')
-            title_link = row_element.select_one('td.css-1c5obzm > div > a')
-
-            if not title_div or not title_link:
-                # Fallback to generic selectors
-                title_link = row_element.select_one('a')
-                if not title_link:
-                    return None
-                title = clean_text(title_link.get_text())
-            else:
-                title = clean_text(title_div.get_text())
+            layout = self.selectors.observe(LISTING_ROW_SCOPE,
+                                            row_fingerprint(row_element))
+
+            def title_probe(selector):
+                title_link = row_element.select_one(selector)
+                if title_link and title_link.get('href'):
+                    title = clean_text(title_link.get_text())
+                    if title:
+                        return title, title_link
+                return None
+
+            found = self.selectors.resolve(layout, 'title', TITLE_SELECTORS,
+                                           title_probe)
+            if not found:
+                return None
+            title, title_link = found
 
             job_url = urllib.parse.urljoin(Config.BASE_URL,
                                            title_link.get('href', ''))
 
-            # Extract company - try multiple column positions
-            company = ""
-            for col_num in [2, 3, 4]:
-                company_cell = row_element.select_one(
-                    f'td:nth-child({col_num})')
-                if company_cell:
-                    company_text = clean_text(company_cell.get_text())
-                    # Skip if it looks like a location or date
-                    if company_text and not any(
-                            indicator in company_text.lower()
-                            for indicator in [
-                                'london', 'uk', 'england', 'kingdom', 'ago',
-                                'day', 'week', 'month'
-                            ]):
-                        company = company_text
-                        break
+            cells = row_element.find_all('td', recursive=False)
 
-            # Extract location - try multiple column positions
-            location = ""
-            for col_num in [3, 4, 5]:
-                location_cell = row_element.select_one(
-                    f'td:nth-child({col_num})')
-                if location_cell:
-                    location_text = clean_text(location_cell.get_text())
-                    # Check if it looks like a location
-                    if location_text and any(
-                            indicator in location_text.lower()
-                            for indicator in [
-                                'london', 'uk', 'england', 'kingdom',
-                                'manchester', 'birmingham', 'scotland', 'wales'
-                            ]):
-                        location = location_text
-                        break
+            def column_probe(looks_right):
 
-            # Extract date posted using the specific selector
-            date_cell = row_element.select_one('td.css-xumdn4')
-            date_posted = ""
-            raw_date_text = ""
-            if date_cell:
-                raw_date_text = clean_text(date_cell.get_text())
-                date_posted = self._parse_date(raw_date_text)
+                def probe(col_num):
+                    if col_num <= len(cells):
+                        text = clean_text(cells[col_num - 1].get_text())
+                        if text and looks_right(text.lower()):
+                            return text
+                    return None
+
+                return probe
+
+            # Company: skip columns that look like a location or date
+            company = self.selectors.resolve(
+                layout, 'company', COMPANY_COLUMNS,
+                column_probe(lambda text: not any(
+                    indicator in text for indicator in [
+                        'london', 'uk', 'england', 'kingdom', 'ago', 'day',
+                        'week', 'month'
+                    ])), confirm=CONFIRM_AFTER) or ""
+
+            # Location: first column that looks like a location
+            location = self.selectors.resolve(
+                layout, 'location', LOCATION_COLUMNS,
+                column_probe(lambda text: any(
+                    indicator in text for indicator in [
+                        'london', 'uk', 'england', 'kingdom', 'manchester',
+                        'birmingham', 'scotland', 'wales'
+                    ])), confirm=CONFIRM_AFTER) or ""
+
+            def date_probe(selector):
+                date_cell = row_element.select_one(selector)
+                if date_cell:
+                    return clean_text(date_cell.get_text()) or None
+                return None
+
+            raw_date_text = self.selectors.resolve(layout, 'date',
+                                                   DATE_SELECTORS,
+                                                   date_probe) or ""
+            date_posted = self._parse_date(
+                raw_date_text) if raw_date_text else None
 
             if title and job_url:
-                return {
-                    'title': title,
-                    'url': job_url,
-                    'company': company,
-                    'location': location,
-                    'date_posted': date_posted,
-                    'raw_date_text': raw_date_text
-                }
+                return Job(title, job_url, company, location, date_posted,
+                           raw_date_text)
 
         except Exception as e:
             logger.debug(f"Error extracting job info from table row: {str(e)}")
@@ -323,120 +374,180 @@ class JobScraper:
         return None
 
     def _parse_date(self, date_text):
-        """Parse date from various formats"""
-        import re
-        from datetime import datetime, timedelta
-
-        if not date_text:
-            return ""
-
-        date_text = date_text.lower().strip()
-
-        # Handle relative dates (e.g., "2 days ago", "1 week ago")
-        if "ago" in date_text:
-            if "day" in date_text:
-                days_match = re.search(r'(\d+)\s*day', date_text)
-                if days_match:
-                    days = int(days_match.group(1))
-                    return (datetime.now() -
-                            timedelta(days=days)).strftime("%Y-%m-%d")
-            elif "week" in date_text:
-                weeks_match = re.search(r'(\d+)\s*week', date_text)
-                if weeks_match:
-                    weeks = int(weeks_match.group(1))
-                    return (datetime.now() -
-                            timedelta(weeks=weeks)).strftime("%Y-%m-%d")
-            elif "month" in date_text:
-                months_match = re.search(r'(\d+)\s*month', date_text)
-                if months_match:
-                    months = int(months_match.group(1))
-                    return (datetime.now() -
-                            timedelta(days=months * 30)).strftime("%Y-%m-%d")
-            elif "hour" in date_text:
-                return datetime.now().strftime("%Y-%m-%d")
-
-        # Handle absolute dates
-        date_patterns = [
-            r"(\d{4})-(\d{1,2})-(\d{1,2})",  # YYYY-MM-DD
-            r"(\d{1,2})/(\d{1,2})/(\d{4})",  # MM/DD/YYYY or DD/MM/YYYY
-            r"(\d{1,2})-(\d{1,2})-(\d{4})",  # MM-DD-YYYY or DD-MM-YYYY
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text)
-            if match:
-                try:
-                    if pattern.startswith(r"(\d{4})"):  # YYYY-MM-DD
-                        year, month, day = match.groups()
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:  # Assume MM/DD/YYYY format
-                        part1, part2, year = match.groups()
-                        # Simple heuristic: if first part > 12, assume DD/MM
-                        if int(part1) > 12:
-                            day, month = part1, part2
-                        else:
-                            month, day = part1, part2
-                        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                except ValueError:
-                    continue
-
-        return date_text  # Return original if no pattern matches
+        """Parse date from various formats into a date object (or None)"""
+        return parse_posted_date(date_text)
 
     def get_job_description(self, job_url):
         """Get detailed job description from job page"""
-        logger.info(f"Fetching job description from: {job_url}")
+        description, _ = self.fetch_job_description(job_url)
+        return description
+
+    def fetch_job_description(self, job_url):
+        """Get the job description and whether it changed since last analysed
+
+        Uses the page cache when enabled: entries within the freshness window
+        are served directly, older ones are revalidated with a conditional
+        request and only re-rendered if the server reports a change.
+        """
+        entry = self.page_cache.get(job_url) if self.page_cache else None
+
+        if entry and self.page_cache.is_fresh(entry):
+            logger.info(f"Using cached job description for: {job_url}")
+            return entry['description'], self.page_cache.has_changed(entry)
+
+        not_modified, etag, last_modified = self._check_page(job_url, entry)
+        if entry and not_modified:
+            logger.info(f"Job page not modified, using cache: {job_url}")
+            self.page_cache.touch(job_url)
+            return entry['description'], self.page_cache.has_changed(entry)
+
+        body, description = self._render_job_page(job_url)
+        if not description:
+            return "", True
+
+        if self.page_cache:
+            entry = self.page_cache.store(job_url, body, description, etag,
+                                          last_modified)
+            return description, self.page_cache.has_changed(entry)
+
+        return description, True
+
+    def mark_description_analyzed(self, job_url):
+        """Record that the cached description for a job has been analysed"""
+        if self.page_cache:
+            self.page_cache.mark_analyzed(job_url)
+
+    def _check_page(self, job_url, entry):
+        """Send a (conditional) request for the page's validators
+
+        Returns (not_modified, etag, last_modified). Only the headers are read;
+        the body is rendered separately by the browser if needed. No request
+        is sent when it could not help: for a cached page without validators
+        (it can never be a 304), or a new page on a host that sends none.
+        """
+        if not self.page_cache:
+            return False, None, None
+
+        if entry:
+            headers = self.page_cache.conditional_headers(entry)
+            if not headers:
+                return False, None, None
+        elif self.page_cache.sends_validators(job_url) is False:
+            return False, None, None
+        else:
+            headers = {}
 
         try:
-            if not self.driver:
-                self.setup_driver()
-
-            self.driver.get(job_url)
+            response = self.rate_limiter.call(job_url, self._head_request,
+                                              job_url, headers)
+        except (TransientFetchError, requests.RequestException) as e:
+            logger.debug(f"Conditional request failed for {job_url}: {e}")
+            return False, None, None
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not entry:
+            self.page_cache.record_validators(job_url,
+                                              bool(etag or last_modified))
+        return response.status_code == 304, etag, last_modified
+
+    def _head_request(self, url, headers):
+        """GET a URL reading only the response headers"""
+        try:
+            response = self.session.get(url,
+                                        headers=headers,
+                                        timeout=10,
+                                        stream=True)
+            response.close()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise TransientFetchError(str(e))
+
+        if response.status_code in RETRYABLE_STATUSES:
+            raise TransientFetchError(
+                f"HTTP {response.status_code}", response.status_code,
+                parse_retry_after(response.headers.get('Retry-After')))
+        return response
+
+    def _load_page(self, driver, url):
+        """Navigate the browser to a URL and wait for the page body
+
+        Raises TransientFetchError on timeouts, navigation errors and error
+        pages (429/5xx) so the rate limiter can back off and retry.
+        """
+        try:
+            driver.get(url)
 
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body")))
+        except (TimeoutException, WebDriverException) as e:
+            raise TransientFetchError(str(e).strip() or type(e).__name__)
 
-            time.sleep(2)
+        match = ERROR_PAGE_TITLE.search(driver.title or "")
+        if match:
+            status = int(match.group(1)) if match.group(1) else None
+            raise TransientFetchError(f"Error page: {driver.title}", status)
 
-            soup = BeautifulSoup(self.driver.page_source, 'html5lib')
+    def _render_job_page(self, job_url):
+        """Load a job page in the browser and return (page_source, description)"""
+        logger.info(f"Fetching job description from: {job_url}")
 
-            # Try different selectors for job description
-            description_selectors = [
-                '.job-description', '.description', '.job-content', '.content',
-                '.job-details', '.details', 'main', '.main-content',
-                '[class*="description"]', '[class*="content"]'
-            ]
+        try:
+            if not self.driver:
+                self.setup_driver()
 
-            description = ""
-            for selector in description_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    description = clean_text(desc_elem.get_text())
-                    if len(description
-                           ) > 100:  # Ensure we got substantial content
-                        break
+            self.rate_limiter.call(job_url, self._load_page, self.driver,
+                                   job_url)
 
-            # If no specific description found, get main content
-            if not description or len(description) < 100:
-                # Remove header, footer, navigation elements
-                for tag in soup(["header", "footer", "nav", "script",
-                                 "style"]):
-                    tag.decompose()
+            time.sleep(2)
 
-                # Get main content
-                main_content = soup.select_one('main') or soup.select_one(
-                    'body')
-                if main_content:
-                    description = clean_text(main_content.get_text())
+            page_source = self.driver.page_source
+            soup = BeautifulSoup(page_source, 'html5lib')
+            description = self._extract_description(soup)
 
             logger.info(
                 f"Extracted description of {len(description)} characters")
-            return description
+            return page_source, description
 
         except Exception as e:
             logger.error(
                 f"Error fetching job description from {job_url}: {str(e)}")
-            return ""
+            return "", ""
+
+    def _extract_description(self, soup):
+        """Extract the job description text from a parsed job page"""
+        layout = self.selectors.observe(DETAIL_PAGE_SCOPE,
+                                        page_fingerprint(soup))
+
+        def probe(selector):
+            if selector == PAGE_TEXT:
+                description = self._page_text(soup)
+            else:
+                desc_elem = soup.select_one(selector)
+                description = clean_text(
+                    desc_elem.get_text()) if desc_elem else ""
+            if len(description) > 100:  # Ensure we got substantial content
+                return description
+            return None
+
+        description = self.selectors.resolve(
+            layout, 'description', DESCRIPTION_SELECTORS + [PAGE_TEXT], probe)
+
+        # Nothing substantial anywhere: use whatever text the page has
+        if description is None:
+            description = self._page_text(soup)
+
+        return description
+
+    def _page_text(self, soup):
+        """Text of the page's main content, without header, footer and nav"""
+        # Remove header, footer, navigation elements
+        for tag in soup(["header", "footer", "nav", "script", "style"]):
+            tag.decompose()
+
+        # Get main content
+        main_content = soup.select_one('main') or soup.select_one('body')
+        return clean_text(main_content.get_text()) if main_content else ""
 
     def get_application_url(self, job_url):
         """Get the actual application URL from the Apply Now button"""
@@ -446,11 +557,8 @@ class JobScraper:
             if not self.driver:
                 self.setup_driver()
 
-            self.driver.get(job_url)
-
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body")))
+            self.rate_limiter.call(job_url, self._load_page, self.driver,
+                                   job_url)
 
             time.sleep(2)
 
@@ -503,8 +611,18 @@ class JobScraper:
                 f"Error extracting application URL from {job_url}: {str(e)}")
             return job_url  # Fallback to original URL
 
-    def close(self):
-        """Close the browser driver"""
+    def close_drivers(self):
+        """Quit the browsers (they are restarted on next use)"""
         if self.driver:
             self.driver.quit()
             self.driver = None
+        if self.listing_driver:
+            self.listing_driver.quit()
+            self.listing_driver = None
+
+    def close(self):
+        """Close the browser drivers and page cache"""
+        self.close_drivers()
+        if self.page_cache:
+            self.page_cache.close()
+            self.page_cache = None
@@ -0,0 +1,112 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Consecutive misses before a learned candidate is replaced. Individual rows
+# legitimately miss now and then (e.g. a company name containing "UK").
+RELEARN_AFTER = 3
+# Consecutive wins before a content-checked candidate (a column position) is
+# learned, so one odd row can't teach a position that merely passes a check
+CONFIRM_AFTER = 3
+
+
+def row_fingerprint(row_element):
+    """Identify a table row layout by the classes of its cells"""
+    return "|".join(" ".join(cell.get('class') or ["-"])
+                    for cell in row_element.find_all('td', recursive=False))
+
+
+def page_fingerprint(soup):
+    """Identify a page layout by the classes of the body's top two levels"""
+    body = soup.body
+    if body is None:
+        return ""
+
+    parts = []
+    for child in body.find_all(recursive=False):
+        parts.append(" ".join(child.get('class') or [child.name]))
+        for grandchild in child.find_all(recursive=False):
+            parts.append(" ".join(grandchild.get('class') or
+                                  [grandchild.name]))
+    return "|".join(parts)
+
+
+class SelectorResolver:
+    """Resolve page fields through fallback candidates, learning the winner
+
+    For each (layout fingerprint, field) the candidate that matched (a CSS
+    selector or column position) is remembered and tried first, so on a
+    stable layout a field costs one lookup instead of a cascade. New layouts
+    and learned candidates that stop matching are logged as layout changes.
+    """
+
+    def __init__(self):
+        self.learned = {}
+        self.misses = {}
+        self.wins = {}  # key -> (candidate, consecutive wins) until learned
+        self.layouts = {}
+        self.stats = {'hits': 0, 'fallbacks': 0, 'misses': 0}
+
+    def observe(self, scope, fingerprint):
+        """Record a layout seen for a scope, reporting layouts not seen before"""
+        known = self.layouts.setdefault(scope, set())
+        if fingerprint not in known:
+            if known:
+                logger.warning(
+                    f"New layout detected for {scope}: {fingerprint!r}")
+            known.add(fingerprint)
+        return fingerprint
+
+    def resolve(self, fingerprint, field, candidates, probe, confirm=1):
+        """Return the first value probe() produces for a candidate, or None
+
+        probe(candidate) returns the extracted value, or None if that
+        candidate does not match. The learned candidate is tried first. A
+        candidate is learned once it has won `confirm` cascades in a row
+        (use CONFIRM_AFTER where a match is a content heuristic).
+        """
+        key = (fingerprint, field)
+        learned = self.learned.get(key)
+
+        if learned is not None:
+            value = probe(learned)
+            if value is not None:
+                self.misses.pop(key, None)
+                self.stats['hits'] += 1
+                return value
+            self.misses[key] = self.misses.get(key, 0) + 1
+
+        self.stats['fallbacks'] += 1
+        for candidate in candidates:
+            if candidate == learned:
+                continue
+            value = probe(candidate)
+            if value is not None:
+                if learned is None:
+                    self._learn(key, candidate, confirm)
+                elif self.misses[key] >= RELEARN_AFTER:
+                    logger.warning(
+                        f"Selector {learned!r} for {field} stopped matching, "
+                        f"switching to {candidate!r}")
+                    self.learned[key] = candidate
+                    del self.misses[key]
+                return value
+
+        self.wins.pop(key, None)  # A row with no match breaks the run
+        self.stats['misses'] += 1
+        return None
+
+    def _learn(self, key, candidate, confirm):
+        previous, wins = self.wins.get(key, (None, 0))
+        wins = wins + 1 if candidate == previous else 1
+        if wins < confirm:
+            self.wins[key] = (candidate, wins)
+            return
+        self.wins.pop(key, None)
+        logger.debug(f"Learned selector {candidate!r} for {key[1]}")
+        self.learned[key] = candidate
+
+    def summary(self):
+        return (f"{self.stats['hits']} cached lookups, "
+                f"{self.stats['fallbacks']} fallback cascades, "
+                f"{self.stats['misses']} misses")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+UK Job Hunt - Sharded Runs
+Splits a crawl across several worker processes (or machines). The coordinator
+collects the listings and partitions them by URL hash into shard files; each
+worker fetches and analyses the jobs in one shard and writes its suitable jobs
+to its own results file; the merge step adds them all to the output CSV with
+global de-duplication. Each worker gets an equal share of the per-host rate
+limit, so the site sees the same total load however many shards there are.
+
+Usage:
+    # Everything on this machine with 4 worker processes
+    python shard.py run --shards 4
+
+    # Across machines: plan here, copy shard files out, work, copy results back
+    python shard.py plan --shards 4 --dir shards
+    python shard.py work shards/shard-00-of-04.jsonl
+    python shard.py merge --dir shards
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+from config import Config
+from models import Job
+from utils import setup_logger, set_log_job_id
+
+logger = logging.getLogger(__name__)
+
+SHARD_FILE_PATTERN = "shard-*-of-*.jsonl"
+SHARD_COUNT_PATTERN = re.compile(r'shard-\d+-of-(\d+)\.jsonl$')
+
+
+def shard_for(url, num_shards):
+    """Stable shard index for a job URL"""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return int(digest, 16) % num_shards
+
+
+def shard_path(shard_dir, index, num_shards):
+    return os.path.join(shard_dir,
+                        f"shard-{index:02d}-of-{num_shards:02d}.jsonl")
+
+
+def shard_count(shard_file):
+    """Number of shards in the plan a shard file belongs to (1 if unknown)"""
+    match = SHARD_COUNT_PATTERN.search(os.path.basename(shard_file))
+    return int(match.group(1)) if match else 1
+
+
+def share_rate_limit(num_workers):
+    """Divide the per-host request rates between concurrent workers
+
+    Every worker fetches from the same host, so each gets 1/num_workers of
+    the rate to keep the total within the configured limits.
+    """
+    if num_workers > 1:
+        Config.RATE_LIMIT_RPS /= num_workers
+        Config.RATE_LIMIT_MIN_RPS /= num_workers
+        Config.RATE_LIMIT_MAX_RPS /= num_workers
+
+
+def results_path(shard_file):
+    """Results file written by the worker for a shard file"""
+    directory, name = os.path.split(shard_file)
+    return os.path.join(directory, "results-" + name)
+
+
+def job_to_json(job):
+    """Serialize a Job as a JSON line"""
+    return json.dumps(job.to_dict(), ensure_ascii=False)
+
+
+def job_from_json(line):
+    return Job.from_dict(json.loads(line))
+
+
+def read_jobs(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [job_from_json(line) for line in f if line.strip()]
+
+
+def plan_shards(num_shards, shard_dir):
+    """Collect job listings and partition them into shard files by URL hash
+
+    Shard and results files from earlier plans in shard_dir are removed
+    first, so merge only sees this plan's results. Jobs in unmerged results
+    were never marked analysed, so they are picked up again by this run.
+    """
+    from scraper import JobScraper
+
+    os.makedirs(shard_dir, exist_ok=True)
+    for pattern in (SHARD_FILE_PATTERN, "results-" + SHARD_FILE_PATTERN):
+        for old_file in glob.glob(os.path.join(shard_dir, pattern)):
+            os.remove(old_file)
+    paths = [shard_path(shard_dir, i, num_shards) for i in range(num_shards)]
+    files = [open(path, "w", encoding="utf-8") for path in paths]
+    scraper = JobScraper()
+    counts = [0] * num_shards
+
+    try:
+        for job in scraper.iter_job_listings():
+            index = shard_for(job.url, num_shards)
+            files[index].write(job_to_json(job) + "\n")
+            counts[index] += 1
+    finally:
+        for f in files:
+            f.close()
+        scraper.close()
+
+    logger.info(
+        f"Planned {sum(counts)} jobs into {num_shards} shards: {counts}")
+    return paths
+
+
+def run_worker(shard_file):
+    """Fetch and analyse every job in a shard file
+
+    Suitable jobs are written to the shard's own results file, so workers
+    never contend for a shared output. Returns the number of suitable jobs,
+    or None if the worker could not start.
+    """
+    from scraper import JobScraper
+    from llm_analyzer import JobAnalyzer
+    from pipeline import process_job, SUITABLE
+    from job_store import JobStore
+    from prioritizer import JobPrioritizer
+
+    jobs = read_jobs(shard_file)
+    logger.info(f"Worker starting on {shard_file} ({len(jobs)} jobs)")
+
+    # All shards' workers share the site's rate limit
+    share_rate_limit(shard_count(shard_file))
+
+    scraper = JobScraper()
+    analyzer = JobAnalyzer()
+    store = JobStore() if Config.JOB_STORE_ENABLED else None
+    suitable_count = 0
+
+    if Config.PRIORITIZE_JOBS:
+        prioritizer = JobPrioritizer(
+            store.company_history() if store else None)
+        jobs.sort(key=prioritizer.score, reverse=True)
+
+    try:
+        if not analyzer.test_connection():
+            logger.error("Cannot connect to Ollama from shard worker")
+            return None
+
+        with open(results_path(shard_file), "w", encoding="utf-8") as out:
+            for i, job in enumerate(jobs, 1):
+                set_log_job_id(job.url)
+                try:
+                    logger.info(f"Processing job {i}/{len(jobs)}: {job.title}")
+                    status = process_job(job, scraper, analyzer, store)
+                    if status == SUITABLE:
+                        out.write(job_to_json(job) + "\n")
+                        out.flush()
+                        suitable_count += 1
+                except Exception as e:
+                    logger.error(f"Error processing job {job.title}: {str(e)}")
+            set_log_job_id(None)
+    finally:
+        scraper.close()
+        if store:
+            store.close()
+
+    logger.info(f"Worker finished {shard_file}: {suitable_count} suitable")
+    return suitable_count
+
+
+def merge_results(shard_dir):
+    """Merge all worker results into the output files, skipping duplicates
+
+    Workers leave suitable jobs unmarked in the page cache; they are marked
+    analysed here once saved, so results that never get merged are analysed
+    again on the next run.
+    """
+    from page_cache import PageCache
+    from results_writer import ResultsWriter
+
+    page_cache = PageCache() if Config.PAGE_CACHE_ENABLED else None
+    try:
+        with ResultsWriter(on_saved=page_cache.mark_analyzed
+                           if page_cache else None) as writer:
+            for path in sorted(
+                    glob.glob(
+                        os.path.join(shard_dir,
+                                     "results-" + SHARD_FILE_PATTERN))):
+                for job in read_jobs(path):
+                    writer.add(job)
+    finally:
+        if page_cache:
+            page_cache.close()
+
+    new_jobs_added = len(writer.added)
+
+    logger.info(
+        f"Merged results into {Config.OUTPUT_FILE}: {new_jobs_added} new jobs")
+    return new_jobs_added
+
+
+def run_local(num_shards, shard_dir):
+    """Plan, run one worker process per shard on this machine, then merge"""
+    paths = plan_shards(num_shards, shard_dir)
+
+    # Separate interpreters rather than forked children, so each worker
+    # gets its own browser, Ollama client and logging listener
+    workers = [
+        subprocess.Popen(
+            [sys.executable,
+             os.path.abspath(__file__), "work", path]) for path in paths
+    ]
+    failed = sum(1 for worker in workers if worker.wait() != 0)
+    if failed:
+        logger.warning(f"{failed} shard worker(s) exited with errors")
+
+    return merge_results(shard_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run a job search split across shards")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan = subparsers.add_parser("plan",
+                                 help="Partition listings into shard files")
+    plan.add_argument("--shards", type=int, default=Config.SHARD_COUNT)
+    plan.add_argument("--dir", default=Config.SHARD_DIR)
+
+    work = subparsers.add_parser("work", help="Process one shard file")
+    work.add_argument("shard_file")
+
+    merge = subparsers.add_parser("merge",
+                                  help="Merge shard results into the output")
+    merge.add_argument("--dir", default=Config.SHARD_DIR)
+
+    run = subparsers.add_parser("run",
+                                help="Plan, work and merge on this machine")
+    run.add_argument("--shards", type=int, default=Config.SHARD_COUNT)
+    run.add_argument("--dir", default=Config.SHARD_DIR)
+
+    args = parser.parse_args(argv)
+    setup_logger()
+
+    if args.command == "plan":
+        for path in plan_shards(args.shards, args.dir):
+            print(path)
+    elif args.command == "work":
+        if run_worker(args.shard_file) is None:
+            return 1
+    elif args.command == "merge":
+        print(f"New jobs added to CSV: {merge_results(args.dir)}")
+    elif args.command == "run":
+        print(f"New jobs added to CSV: {run_local(args.shards, args.dir)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
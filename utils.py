@@ -1,17 +1,94 @@
+import atexit
+import contextlib
+import contextvars
+import json
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from config import Config
+from dates import get_date_window, to_date
+
+logger = logging.getLogger(__name__)
+
+# Listener that drains queued log records to the console and log file
+_log_listener = None
+
+# Identifier of the job currently being processed, attached to log records
+_current_job_id = contextvars.ContextVar("job_id", default=None)
+
+
+class JobIdFilter(logging.Filter):
+    """Attach the current job ID to every record logged while it is set"""
+
+    def filter(self, record):
+        record.job_id = _current_job_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        job_id = getattr(record, 'job_id', None)
+        if job_id:
+            entry['job_id'] = job_id
+        return json.dumps(entry, ensure_ascii=False)
 
 
 def setup_logger():
-    """Set up logging configuration"""
-    logging.basicConfig(level=logging.INFO,
-                        format='%(asctime)s - %(levelname)s - %(message)s',
-                        handlers=[
-                            logging.FileHandler(Config.LOG_FILE),
-                            logging.StreamHandler()
-                        ])
-    return logging.getLogger(__name__)
+    """Set up logging configuration (only the first call configures handlers)
+
+    Entry points call this once; modules log through
+    logging.getLogger(__name__). Records are put on a queue by the calling
+    thread and written to the console and log file by a background
+    QueueListener. QueueHandler formats any traceback into the message
+    before queueing, so JSON records carry it there.
+    """
+    global _log_listener
+
+    if _log_listener is None:
+        if Config.LOG_JSON:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s')
+
+        handlers = [
+            logging.FileHandler(Config.LOG_FILE, encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(JobIdFilter())
+
+        root = logging.getLogger()
+        root.setLevel(
+            getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO))
+        root.addHandler(queue_handler)
+
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+
+def set_log_job_id(job_id):
+    """Tag subsequent log records from this context with a job ID"""
+    _current_job_id.set(job_id)
 
 
 def is_excluded_job(job_title):
@@ -43,55 +120,50 @@ def load_existing_jobs():
                                                             '').strip())
                     existing_jobs.add(job_key)
         except Exception as e:
-            logger = setup_logger()
             logger.warning(f"Error reading existing CSV file: {e}")
 
     return existing_jobs
 
 
-def save_suitable_job(job_url, job_title, job_info=None):
-    """Save a suitable job to the CSV output file if it's not a duplicate"""
-    import csv
-    import os
-
-    # Load existing jobs to check for duplicates
-    existing_jobs = load_existing_jobs()
-
-    company = job_info.get('company', '') if job_info else ''
-    location = job_info.get('location', '') if job_info else ''
-
-    # Create job key for duplicate checking
-    job_key = (job_title.strip(), company.strip())
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive lock on `path`.lock across processes
 
-    # Check if this job already exists
-    if job_key in existing_jobs:
-        logger = setup_logger()
-        logger.info(f"Skipping duplicate job: {job_title} at {company}")
-        return False
-
-    # Prepare simplified row data
-    row_data = {
-        'job_title': job_title,
-        'location': location,
-        'job_url': job_url,
-        'company': company,
-        'applied': ''  # Empty by default for user to fill in
-    }
+    Uses fcntl advisory locks where available (no-op on Windows).
+    """
+    with open(path + ".lock", "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
 
-    # Check if file exists to determine if we need to write headers
-    file_exists = os.path.exists(Config.OUTPUT_FILE)
 
-    with open(Config.OUTPUT_FILE, "a", newline="", encoding="utf-8") as f:
-        fieldnames = ['job_title', 'location', 'job_url', 'company', 'applied']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+def save_suitable_job(job_url, job_title, job_info=None, existing_jobs=None):
+    """Save a suitable job to the output files if it's not a duplicate
 
-        # Write header if file is new
-        if not file_exists:
-            writer.writeheader()
+    `job_info` is a dict with 'company' and 'location' keys or a Job. The row
+    is written immediately through a one-row results_writer.ResultsWriter.
+    Callers can pass their own `existing_jobs` set (from load_existing_jobs)
+    to skip re-reading the CSV; it is updated with the saved job.
+    """
+    from models import Job
+    from results_writer import ResultsWriter
 
-        writer.writerow(row_data)
+    if isinstance(job_info, dict):
+        company = job_info.get('company', '')
+        location = job_info.get('location', '')
+    else:
+        company = job_info.company if job_info else ''
+        location = job_info.location if job_info else ''
 
-    return True
+    writer = ResultsWriter(batch_size=1,
+                           new_jobs_file="",
+                           existing_jobs=existing_jobs)
+    writer.add(Job(job_title, job_url, company, location), job_url)
+    return writer.close() > 0
 
 
 def clean_text(text):
@@ -125,27 +197,9 @@ def extract_date_from_text(text):
 
 def is_within_date_range(job_date):
     """Check if job posting date is within the configured date range"""
-    from datetime import datetime, timedelta
-
-    if not job_date:
-        return True  # If no date available, include the job
-
     try:
-        # Parse the job date
-        if isinstance(job_date, str):
-            job_date_obj = datetime.strptime(job_date, "%Y-%m-%d")
-        else:
-            job_date_obj = job_date
-
-        # Calculate date boundaries
-        today = datetime.now()
-        max_age = today - timedelta(days=Config.MAX_JOB_AGE_DAYS)
-        min_age = today - timedelta(days=Config.MIN_JOB_AGE_DAYS)
-
-        # Check if job date is within range
-        return max_age <= job_date_obj <= min_age
+        return get_date_window().contains(to_date(job_date))
 
     except (ValueError, TypeError) as e:
-        logger = setup_logger()
         logger.debug(f"Error parsing job date '{job_date}': {e}")
         return True  # Include job if date parsing fails